@@ -5,6 +5,7 @@ Implements HTTP, TCP, UDP, and ICMP tests with multi-threading support
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import sys
@@ -107,7 +108,6 @@ class WaddlePerfClient:
             pass
 
         # Fallback to hostname-based ID
-        import hashlib
         return hashlib.sha256(socket.gethostname().encode()).hexdigest()[:32]
 
     async def _create_session(self) -> aiohttp.ClientSession:
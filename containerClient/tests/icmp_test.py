@@ -4,12 +4,17 @@
 import asyncio
 import time
 import logging
+import platform
+import re
 import struct
 import socket
 import os
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field, asdict
 
+# Precompiled parser for the min/avg/max line of Linux/macOS ping output
+_PING_AVG_PATTERN = re.compile(r'min/avg/max[^=]*=\s*[\d.]+/([\d.]+)/')
+
 
 @dataclass
 class IcmpTestResult:
@@ -196,7 +201,6 @@ class IcmpTest:
             result.target_ip = await self._resolve_host(host) or host
 
             # Use system ping command
-            import platform
             system = platform.system().lower()
 
             if system == "windows":
@@ -228,8 +232,7 @@ class IcmpTest:
             # Try to extract average time
             if "avg" in output.lower():
                 # Linux/Mac format
-                import re
-                match = re.search(r'min/avg/max[^=]*=\s*[\d.]+/([\d.]+)/', output)
+                match = _PING_AVG_PATTERN.search(output)
                 if match:
                     result.latency_ms = float(match.group(1))
                     result.success = True
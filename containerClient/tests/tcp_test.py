@@ -56,15 +56,15 @@ class TcpTest:
             result.target_ip = await self._resolve_host(host) or ""
 
             # Connect to target
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
 
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(host, port),
                 timeout=self.timeout
             )
 
-            connect_time = time.perf_counter()
-            result.connection_time_ms = (connect_time - start_time) * 1000
+            connect_ns = time.perf_counter_ns()
+            result.connection_time_ms = (connect_ns - start_ns) / 1e6
             result.latency_ms = result.connection_time_ms
 
             # Close connection
@@ -106,15 +106,15 @@ class TcpTest:
             ssl_context = ssl.create_default_context()
 
             # Connect to target with TLS
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
 
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(host, port, ssl=ssl_context, server_hostname=host),
                 timeout=self.timeout
             )
 
-            connect_time = time.perf_counter()
-            result.connection_time_ms = (connect_time - start_time) * 1000
+            connect_ns = time.perf_counter_ns()
+            result.connection_time_ms = (connect_ns - start_ns) / 1e6
             result.latency_ms = result.connection_time_ms
 
             # Get TLS information
@@ -163,7 +163,7 @@ class TcpTest:
             result.target_ip = await self._resolve_host(host) or ""
 
             # Connect and read SSH banner
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
 
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(host, port),
@@ -176,8 +176,8 @@ class TcpTest:
                 timeout=2
             )
 
-            connect_time = time.perf_counter()
-            result.connection_time_ms = (connect_time - start_time) * 1000
+            connect_ns = time.perf_counter_ns()
+            result.connection_time_ms = (connect_ns - start_ns) / 1e6
             result.latency_ms = result.connection_time_ms
 
             # Close connection
@@ -154,16 +154,16 @@ class UdpTest:
             result.target_ip = await self._resolve_host(dns_server) or dns_server
 
             # Simple DNS query timing (using system resolver)
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
 
             try:
                 await asyncio.wait_for(
                     self._resolve_host(host),
                     timeout=self.timeout
                 )
-                end_time = time.perf_counter()
+                end_ns = time.perf_counter_ns()
 
-                result.latency_ms = (end_time - start_time) * 1000
+                result.latency_ms = (end_ns - start_ns) / 1e6
                 result.success = True
                 result.packets_sent = 1
                 result.packets_received = 1
@@ -0,0 +1,23 @@
+-- Migration: Drop redundant secondary indexes on auth lookup columns
+--
+-- The auth queries filter on (session_id, expires_at), (api_key, is_active)
+-- and (username, is_active). All three leading columns carry UNIQUE
+-- constraints, so each lookup is already a unique-index point read that
+-- fetches at most one row; the residual predicate (expires_at / is_active)
+-- then filters that single row. Compound indexes on these pairs would add
+-- nothing, and the plain secondary indexes below exactly duplicate the
+-- UNIQUE key prefixes -- they are never chosen by the optimizer and only
+-- add write amplification on every INSERT/UPDATE.
+--
+-- To confirm on a live instance, EXPLAIN the three auth queries: access
+-- type stays ref/eq_ref on the UNIQUE keys before and after this change.
+
+USE waddleperf;
+
+ALTER TABLE users
+DROP INDEX idx_username,
+DROP INDEX idx_email,
+DROP INDEX idx_api_key;
+
+ALTER TABLE sessions
+DROP INDEX idx_session_id;
@@ -23,6 +23,33 @@ class StreamMessage:
         return json.dumps(asdict(self))
 
 
+# Pre-rendered frames for fixed-payload messages. These are sent on every
+# ping/cancel/error path, so serializing them once at import time avoids
+# per-send dataclass + json.dumps allocations on high-rate connections.
+_PONG_FRAME = json.dumps({'event': 'pong', 'data': {}})
+_TEST_CANCELLED_FRAME = json.dumps({
+    'event': 'test_cancelled',
+    'data': {'message': 'Test execution cancelled'}
+})
+_INVALID_JSON_FRAME = json.dumps({
+    'event': 'error',
+    'data': {'message': 'Invalid JSON format'}
+})
+_MISSING_TEST_NAME_FRAME = json.dumps({
+    'event': 'error',
+    'data': {'message': 'Missing required parameter: test_name'}
+})
+_TESTSERVER_UNAVAILABLE_FRAME = json.dumps({
+    'event': 'error',
+    'data': {'message': 'Failed to connect to testServer'}
+})
+# Template frame with a single JSON-encoded placeholder for the test name
+_TEST_STARTED_TMPL = (
+    '{"event": "test_started", "data": '
+    '{"test_name": %s, "message": "Test execution started"}}'
+)
+
+
 async def validate_websocket_session(session_id: str) -> Optional[int]:
     """Authenticate WebSocket connection using session_id.
 
@@ -78,15 +105,22 @@ async def validate_websocket_session(session_id: str) -> Optional[int]:
 
 
 async def execute_test_with_streaming(
-    test_params: Dict[str, Any]
-) -> Optional[asyncio.StreamReader]:
-    """Call testServer API with aiohttp and return response stream.
+    test_params: Dict[str, Any],
+    ws
+) -> bool:
+    """Call testServer API and stream progress to the WebSocket client.
+
+    The aiohttp session and response contexts stay open for the whole
+    stream so that cancellation (e.g. a replacing start_test) unwinds
+    through the context managers and returns the connection cleanly
+    instead of leaving a half-read response.
 
     Args:
         test_params: Test execution parameters
+        ws: WebSocket connection object
 
     Returns:
-        Response stream reader or None on error
+        True if the test was executed and streamed, False on error
     """
     try:
         testserver_url = current_app.config.get(
@@ -109,20 +143,21 @@ async def execute_test_with_streaming(
                     logger.error(
                         f"testServer returned {resp.status}: {error_text}"
                     )
-                    return None
+                    return False
 
-                # Return the response for streaming
-                return resp
+                # Stream progress while the response is still open
+                await stream_test_progress(resp, ws)
+                return True
 
     except asyncio.TimeoutError:
         logger.error("testServer request timeout")
-        return None
+        return False
     except aiohttp.ClientError as e:
         logger.error(f"HTTP client error: {str(e)}")
-        return None
+        return False
     except Exception as e:
         logger.error(f"Error executing test: {str(e)}")
-        return None
+        return False
 
 
 async def stream_test_progress(
@@ -225,49 +260,44 @@ async def handle_test_execution() -> None:
 
     test_task = None
     try:
-        async for message in ws.receive():
-            try:
-                msg_data = json.loads(message)
-                event = msg_data.get('event')
-
-                if event == 'start_test':
-                    # Cancel previous test if running
-                    if test_task and not test_task.done():
-                        test_task.cancel()
-                        logger.info("Cancelled previous test task")
-
-                    # Extract test parameters
-                    params = msg_data.get('data', {})
-                    logger.info(f"Received start_test event with params: {params}")
-
-                    # Start test execution task
-                    test_task = asyncio.create_task(
-                        _run_test_stream(ws, params)
-                    )
-
-                elif event == 'cancel_test':
-                    # Cancel running test
-                    if test_task and not test_task.done():
-                        test_task.cancel()
-                        msg = StreamMessage(
-                            event='test_cancelled',
-                            data={'message': 'Test execution cancelled'}
+        # TaskGroup gives structured cleanup: any test task still running
+        # when the receive loop ends is awaited (or cancelled) on exit
+        # instead of being orphaned.
+        async with asyncio.TaskGroup() as task_group:
+            async for message in ws.receive():
+                try:
+                    msg_data = json.loads(message)
+                    event = msg_data.get('event')
+
+                    if event == 'start_test':
+                        # Cancel previous test if running
+                        if test_task and not test_task.done():
+                            test_task.cancel()
+                            logger.info("Cancelled previous test task")
+
+                        # Extract test parameters
+                        params = msg_data.get('data', {})
+                        logger.info(f"Received start_test event with params: {params}")
+
+                        # Start test execution task
+                        test_task = task_group.create_task(
+                            _run_test_stream(ws, params)
                         )
-                        await ws.send(msg.to_json())
-                        logger.info("Test execution cancelled")
 
-                elif event == 'ping':
-                    # Respond to ping to keep connection alive
-                    msg = StreamMessage(event='pong', data={})
-                    await ws.send(msg.to_json())
+                    elif event == 'cancel_test':
+                        # Cancel running test
+                        if test_task and not test_task.done():
+                            test_task.cancel()
+                            await ws.send(_TEST_CANCELLED_FRAME)
+                            logger.info("Test execution cancelled")
+
+                    elif event == 'ping':
+                        # Respond to ping to keep connection alive
+                        await ws.send(_PONG_FRAME)
 
-            except json.JSONDecodeError:
-                logger.warning("Received invalid JSON from client")
-                msg = StreamMessage(
-                    event='error',
-                    data={'message': 'Invalid JSON format'}
-                )
-                await ws.send(msg.to_json())
+                except json.JSONDecodeError:
+                    logger.warning("Received invalid JSON from client")
+                    await ws.send(_INVALID_JSON_FRAME)
 
     except asyncio.CancelledError:
         logger.info(f"WebSocket handler cancelled for user {user_id}")
@@ -299,35 +329,16 @@ async def _run_test_stream(ws, params: Dict[str, Any]) -> None:
     try:
         # Validate required parameters
         if not params.get('test_name'):
-            msg = StreamMessage(
-                event='error',
-                data={'message': 'Missing required parameter: test_name'}
-            )
-            await ws.send(msg.to_json())
+            await ws.send(_MISSING_TEST_NAME_FRAME)
             return
 
-        # Send test_started event
-        msg = StreamMessage(
-            event='test_started',
-            data={
-                'test_name': params.get('test_name'),
-                'message': 'Test execution started'
-            }
-        )
-        await ws.send(msg.to_json())
-
-        # Execute test with testServer
-        response = await execute_test_with_streaming(params)
-        if not response:
-            msg = StreamMessage(
-                event='error',
-                data={'message': 'Failed to connect to testServer'}
-            )
-            await ws.send(msg.to_json())
-            return
+        # Send test_started event (pre-rendered template, only the name varies)
+        await ws.send(_TEST_STARTED_TMPL % json.dumps(params.get('test_name')))
 
-        # Stream progress updates
-        await stream_test_progress(response, ws)
+        # Execute test and stream progress from testServer
+        executed = await execute_test_with_streaming(params, ws)
+        if not executed:
+            await ws.send(_TESTSERVER_UNAVAILABLE_FRAME)
 
     except asyncio.CancelledError:
         logger.info("Test stream task cancelled")
@@ -7,6 +7,8 @@ to validate licenses and check feature entitlements.
 
 import os
 import json
+import re
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
@@ -17,6 +19,24 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# License key format: PENG-XXXX-XXXX-XXXX-XXXX-ABCD. One anchored regex
+# pass also enforces the character classes the old length/dash checks
+# let through.
+_LICENSE_KEY_RE = re.compile(
+    r"^PENG-[A-Z0-9]{4}-[A-Z0-9]{4}-[A-Z0-9]{4}-[A-Z0-9]{4}-[A-Z0-9]{4}$"
+)
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to compact JSON bytes.
+
+    Pre-encoding and posting data= skips requests' per-call dumps with
+    default (space-padded) separators; the session already carries the
+    application/json Content-Type header.
+    """
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
 class FeatureNotAvailableError(Exception):
     """Raised when a required feature is not available in the current license."""
@@ -57,6 +77,12 @@ class PenguinTechLicenseClient:
         self.server_id = None
         self.timeout = timeout
 
+        # Endpoint URLs are fixed for the client's lifetime; building
+        # them once keeps per-call work to the POST itself
+        self._validate_url = f"{self.base_url}/api/v2/validate"
+        self._features_url = f"{self.base_url}/api/v2/features"
+        self._keepalive_url = f"{self.base_url}/api/v2/keepalive"
+
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -66,11 +92,24 @@ class PenguinTechLicenseClient:
         )
         self.session.timeout = timeout
 
-        # Feature cache
+        # Tune the connection pool so frequent check_feature/keepalive
+        # calls reuse warm TCP+TLS connections instead of paying a
+        # handshake whenever the default pool evicts them
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Feature cache (timestamps on the monotonic clock: immune to
+        # wall-clock jumps and cheaper to read on most platforms)
         self._feature_cache = {}
         self._cache_timestamp = None
         self._cache_ttl = 300  # 5 minutes
 
+        # Stale-while-revalidate state: coalesces background refreshes
+        # so at most one thread is revalidating at a time
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
     @classmethod
     def from_env(cls, timeout: int = 30) -> Optional["PenguinTechLicenseClient"]:
         """
@@ -109,11 +148,14 @@ class PenguinTechLicenseClient:
         """
         try:
             response = self.session.post(
-                f"{self.base_url}/api/v2/validate", json={"product": self.product}
+                self._validate_url,
+                data=_dumps({"product": self.product}),
             )
             response.raise_for_status()
 
-            data = response.json()
+            # json.loads on the raw bytes skips requests' charset
+            # detection; the license server always answers UTF-8 JSON
+            data = json.loads(response.content)
 
             if not data.get("valid"):
                 raise LicenseValidationError(
@@ -136,6 +178,12 @@ class PenguinTechLicenseClient:
         """
         Check if a specific feature is enabled.
 
+        On cache miss the client revalidates the license once, which
+        returns the full feature list, rather than issuing one POST per
+        feature — decorator-gated startup paths otherwise serialize N
+        round-trips. Pass use_cache=False to force a per-feature
+        refresh against /api/v2/features.
+
         Args:
             feature: Feature name to check
             use_cache: Whether to use cached results
@@ -143,29 +191,46 @@ class PenguinTechLicenseClient:
         Returns:
             True if feature is enabled, False otherwise
         """
-        # Check cache first if enabled and valid
-        if use_cache and self._is_cache_valid():
-            cached_result = self._feature_cache.get(feature)
-            if cached_result is not None:
-                return cached_result
+        if use_cache:
+            if not self._is_cache_valid():
+                if self._feature_cache:
+                    # Stale-while-revalidate: serve the stale answer
+                    # and refresh in the background so hot decorator
+                    # paths never block on the network after the first
+                    # validation
+                    self._refresh_async()
+                else:
+                    # Nothing cached yet; block once for the initial
+                    # validate() round trip
+                    try:
+                        self.validate()
+                    except LicenseValidationError as e:
+                        logger.error(f"Feature cache refresh failed: {e}")
+                        return False
+            return self._feature_cache.get(feature, False)
 
         try:
             response = self.session.post(
-                f"{self.base_url}/api/v2/features",
-                json={"product": self.product, "feature": feature},
+                self._features_url,
+                data=_dumps({"product": self.product, "feature": feature}),
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json.loads(response.content)
             features = data.get("features", [])
 
             if features:
                 entitled = features[0].get("entitled", False)
                 # Cache the result
                 self._feature_cache[feature] = entitled
-                self._cache_timestamp = time.time()
+                self._cache_timestamp = time.monotonic()
                 return entitled
 
+            # Negative-cache unknown features so hot decorators with
+            # misconfigured names don't re-hit the server every call;
+            # the entry is dropped at the next full cache refresh
+            self._feature_cache[feature] = False
+            self._cache_timestamp = self._cache_timestamp or time.monotonic()
             return False
 
         except requests.RequestException as e:
@@ -198,11 +263,11 @@ class PenguinTechLicenseClient:
 
         try:
             response = self.session.post(
-                f"{self.base_url}/api/v2/keepalive", json=payload
+                self._keepalive_url, data=_dumps(payload)
             )
             response.raise_for_status()
 
-            return response.json()
+            return json.loads(response.content)
 
         except requests.RequestException as e:
             raise LicenseValidationError(f"Keepalive request failed: {e}")
@@ -231,14 +296,38 @@ class PenguinTechLicenseClient:
             if name:
                 self._feature_cache[name] = entitled
 
-        self._cache_timestamp = time.time()
+        self._cache_timestamp = time.monotonic()
+
+    def _refresh_async(self) -> None:
+        """Refresh the feature cache on a background thread.
+
+        Coalesced: if a refresh is already in flight, callers return
+        immediately and keep serving the stale cache.
+        """
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _refresh() -> None:
+            try:
+                self.validate()
+            except LicenseValidationError as e:
+                logger.error(f"Background feature cache refresh failed: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing = False
+
+        threading.Thread(
+            target=_refresh, name="license-cache-refresh", daemon=True
+        ).start()
 
     def _is_cache_valid(self) -> bool:
         """Check if the feature cache is still valid."""
         if self._cache_timestamp is None:
             return False
 
-        return (time.time() - self._cache_timestamp) < self._cache_ttl
+        return (time.monotonic() - self._cache_timestamp) < self._cache_ttl
 
     @staticmethod
     def is_valid_license_key(key: str) -> bool:
@@ -251,14 +340,7 @@ class PenguinTechLicenseClient:
         Returns:
             True if format is valid
         """
-        if not key or len(key) != 29:
-            return False
-
-        if not key.startswith("PENG-"):
-            return False
-
-        # Count dashes - should be 5 total
-        return key.count("-") == 5
+        return bool(key) and _LICENSE_KEY_RE.match(key) is not None
 
 
 # Global client instance for convenience
@@ -295,6 +377,13 @@ def requires_feature(
             if not license_client:
                 raise FeatureNotAvailableError(feature_name)
 
+            # Fast path: an entitled feature costs one dict read per
+            # call; fall through to check_feature (which may refresh)
+            # only when the feature is unknown or the cache is stale
+            cached = license_client._feature_cache.get(feature_name)
+            if cached is True and license_client._is_cache_valid():
+                return func(*args, **kwargs)
+
             if not license_client.check_feature(feature_name):
                 raise FeatureNotAvailableError(feature_name)
 
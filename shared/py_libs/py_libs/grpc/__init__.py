@@ -12,6 +12,7 @@ from .interceptors import (
     RateLimitInterceptor,
     AuditInterceptor,
     CorrelationInterceptor,
+    ObservabilityInterceptor,
     RecoveryInterceptor,
 )
 
@@ -23,5 +24,6 @@ __all__ = [
     "RateLimitInterceptor",
     "AuditInterceptor",
     "CorrelationInterceptor",
+    "ObservabilityInterceptor",
     "RecoveryInterceptor",
 ]
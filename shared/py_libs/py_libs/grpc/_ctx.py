@@ -0,0 +1,25 @@
+"""
+Shared context variables for gRPC interceptors and handlers.
+
+CorrelationInterceptor stores the per-RPC correlation ID here so other
+interceptors and service handlers can read it without re-scanning the
+invocation metadata. AuthInterceptor records the authenticated user the
+same way.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Optional
+
+# Correlation ID for the current RPC ("unknown" outside an RPC or when
+# CorrelationInterceptor is not installed)
+correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="unknown")
+
+# Authenticated user ID (the JWT 'sub' claim) for the current RPC
+user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+
+# Decoded JWT payload, set by AuthInterceptor for the duration of the
+# interceptor chain so downstream interceptors (e.g. the rate limiter)
+# don't re-parse the same token
+jwt_payload_var: ContextVar[Optional[dict]] = ContextVar("jwt_payload", default=None)
@@ -4,9 +4,13 @@ gRPC client with connection management, retries, and TLS support.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import random
 import time
 from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Callable, Optional, TypeVar
 
 import grpc
@@ -15,6 +19,56 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Module-level RNG so concurrent clients don't contend on shared state
+_rng = random.SystemRandom()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_credentials(
+    ca_path: Optional[str],
+    cert_path: Optional[str],
+    key_path: Optional[str],
+    ca_mtime: Optional[int],
+    cert_mtime: Optional[int],
+    key_mtime: Optional[int],
+) -> grpc.ChannelCredentials:
+    """
+    Load and cache TLS channel credentials.
+
+    Services that fan out to many peers construct many clients, each of
+    which would otherwise re-read and re-parse the same PEM files. The
+    cache key includes file mtimes so rotated certificates invalidate
+    the cached entry.
+    """
+    root_certs = None
+    if ca_path:
+        with open(ca_path, "rb") as f:
+            root_certs = f.read()
+
+    private_key = None
+    certificate_chain = None
+    if cert_path and key_path:
+        with open(key_path, "rb") as f:
+            private_key = f.read()
+        with open(cert_path, "rb") as f:
+            certificate_chain = f.read()
+
+    return grpc.ssl_channel_credentials(
+        root_certificates=root_certs,
+        private_key=private_key,
+        certificate_chain=certificate_chain,
+    )
+
+
+def _mtime_ns(path: Optional[str]) -> Optional[int]:
+    """Return a file's mtime in nanoseconds, or None if unset/missing."""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 @dataclass(slots=True, frozen=True)
 class ClientOptions:
@@ -31,23 +85,44 @@ class ClientOptions:
     client_key_path: Optional[str] = None
     keepalive_time_ms: int = 60000  # 1 minute
     keepalive_timeout_ms: int = 20000  # 20 seconds
+    pool_size: int = 4  # Number of channels to spread streams across
+    jitter: str = "full"  # Backoff jitter mode: "full" or "none"
+    max_retry_tokens: int = 10  # Client-wide retry budget (token bucket)
+    retry_refill_per_sec: float = 1.0  # Budget refill rate
 
 
 class GrpcClient:
     """
     gRPC client wrapper with connection management and retry logic.
 
+    Maintains a small pool of channels and hands them out round-robin so
+    concurrent RPCs are spread across multiple HTTP/2 connections instead
+    of contending for one connection's stream limit and flow-control
+    window.
+
     Example:
         >>> from py_libs.grpc import GrpcClient, ClientOptions
         >>> options = ClientOptions(enable_tls=True)
         >>> client = GrpcClient('localhost:50051', options)
         >>>
         >>> # Use with stub
-        >>> with client.channel() as channel:
-        >>>     stub = MyServiceStub(channel)
-        >>>     response = stub.MyMethod(request)
+        >>> stub = MyServiceStub(client.channel())
+        >>> response = stub.MyMethod(request)
     """
 
+    # Status codes that should never be retried; frozenset so the retry
+    # loop does a single hash lookup instead of rebuilding a tuple per
+    # attempt and scanning it linearly
+    _NON_RETRYABLE = frozenset(
+        {
+            grpc.StatusCode.INVALID_ARGUMENT,
+            grpc.StatusCode.NOT_FOUND,
+            grpc.StatusCode.ALREADY_EXISTS,
+            grpc.StatusCode.PERMISSION_DENIED,
+            grpc.StatusCode.UNAUTHENTICATED,
+        }
+    )
+
     def __init__(
         self,
         target: str,
@@ -62,28 +137,50 @@ class GrpcClient:
         """
         self.target = target
         self.options = options or ClientOptions()
-        self._channel: Optional[grpc.Channel] = None
+        self._channels: list[grpc.Channel] = []
+        self._rr_index = 0
+        self._rr_lock = Lock()
+        # Shared retry budget across all calls on this client; bounds
+        # the aggregate retry rate so broad server degradation does not
+        # multiply offered load by max_retries (retry storm)
+        self._retry_tokens = float(self.options.max_retry_tokens)
+        self._retry_refill_ts = time.monotonic()
+        self._retry_lock = Lock()
 
         logger.info(f"gRPC client initialized for {target}")
 
     def channel(self) -> grpc.Channel:
         """
-        Get or create gRPC channel.
+        Get a gRPC channel from the pool (round-robin).
+
+        Channels are created lazily on first use.
 
         Returns:
             gRPC channel instance
         """
-        if self._channel is None:
-            self._channel = self._create_channel()
-        return self._channel
-
-    def _create_channel(self) -> grpc.Channel:
+        with self._rr_lock:
+            # Double-checked under the lock: two threads racing a fresh
+            # client would otherwise both build full pools and orphan
+            # the loser's channels unclosed
+            if not self._channels:
+                self._channels = [
+                    self._create_channel(i)
+                    for i in range(max(1, self.options.pool_size))
+                ]
+
+            self._rr_index = (self._rr_index + 1) % len(self._channels)
+            return self._channels[self._rr_index]
+
+    def _create_channel(self, index: int = 0) -> grpc.Channel:
         """Create gRPC channel with configuration."""
         channel_options = [
             ("grpc.keepalive_time_ms", self.options.keepalive_time_ms),
             ("grpc.keepalive_timeout_ms", self.options.keepalive_timeout_ms),
             ("grpc.keepalive_permit_without_calls", 1),
             ("grpc.http2.max_pings_without_data", 0),
+            # Unique per-channel argument so gRPC does not share one
+            # subchannel (and thus one TCP connection) across the pool
+            ("grpc.channel_number", index),
         ]
 
         if self.options.enable_tls:
@@ -104,24 +201,17 @@ class GrpcClient:
         return channel
 
     def _create_credentials(self) -> grpc.ChannelCredentials:
-        """Create TLS credentials for secure channel."""
-        root_certs = None
-        if self.options.ca_cert_path:
-            with open(self.options.ca_cert_path, "rb") as f:
-                root_certs = f.read()
-
-        private_key = None
-        certificate_chain = None
-        if self.options.client_cert_path and self.options.client_key_path:
-            with open(self.options.client_key_path, "rb") as f:
-                private_key = f.read()
-            with open(self.options.client_cert_path, "rb") as f:
-                certificate_chain = f.read()
-
-        return grpc.ssl_channel_credentials(
-            root_certificates=root_certs,
-            private_key=private_key,
-            certificate_chain=certificate_chain,
+        """Create (or reuse cached) TLS credentials for secure channel."""
+        ca_path = self.options.ca_cert_path
+        cert_path = self.options.client_cert_path
+        key_path = self.options.client_key_path
+        return _load_credentials(
+            ca_path,
+            cert_path,
+            key_path,
+            _mtime_ns(ca_path),
+            _mtime_ns(cert_path),
+            _mtime_ns(key_path),
         )
 
     def call_with_retry(
@@ -146,15 +236,13 @@ class GrpcClient:
 
         Example:
             >>> client = GrpcClient('localhost:50051')
-            >>> with client.channel() as channel:
-            >>>     stub = MyServiceStub(channel)
-            >>>     response = client.call_with_retry(
-            >>>         stub.MyMethod,
-            >>>         request,
-            >>>         timeout=10.0
-            >>>     )
+            >>> stub = MyServiceStub(client.channel())
+            >>> response = client.call_with_retry(
+            >>>     stub.MyMethod,
+            >>>     request,
+            >>>     timeout=10.0
+            >>> )
         """
-        backoff_ms = self.options.initial_backoff_ms
         last_exception = None
 
         for attempt in range(self.options.max_retries):
@@ -170,18 +258,20 @@ class GrpcClient:
                 code = e.code()
 
                 # Don't retry on certain errors
-                if code in (
-                    grpc.StatusCode.INVALID_ARGUMENT,
-                    grpc.StatusCode.NOT_FOUND,
-                    grpc.StatusCode.ALREADY_EXISTS,
-                    grpc.StatusCode.PERMISSION_DENIED,
-                    grpc.StatusCode.UNAUTHENTICATED,
-                ):
+                if code in self._NON_RETRYABLE:
                     logger.error(f"Non-retryable error: {code}", exc_info=True)
                     raise
 
                 # Retry on transient errors
                 if attempt < self.options.max_retries - 1:
+                    if not self._take_retry_token():
+                        logger.warning(
+                            f"Retry budget exhausted for {self.target}; "
+                            f"failing fast: {code}"
+                        )
+                        raise
+
+                    backoff_ms = self._retry_delay_ms(attempt)
                     logger.warning(
                         f"RPC failed (attempt {attempt + 1}/{self.options.max_retries}): {code}",
                         extra={
@@ -190,12 +280,8 @@ class GrpcClient:
                         },
                     )
 
-                    # Exponential backoff
+                    # Jittered exponential backoff
                     time.sleep(backoff_ms / 1000.0)
-                    backoff_ms = min(
-                        backoff_ms * self.options.backoff_multiplier,
-                        self.options.max_backoff_ms,
-                    )
                 else:
                     logger.error(
                         f"RPC failed after {self.options.max_retries} attempts",
@@ -207,12 +293,63 @@ class GrpcClient:
             raise last_exception
         raise RuntimeError("Unexpected error in call_with_retry")
 
+    def _take_retry_token(self) -> bool:
+        """
+        Take one token from the client-wide retry budget.
+
+        The bucket refills at retry_refill_per_sec up to
+        max_retry_tokens. When empty, callers should fail fast instead
+        of retrying, capping the aggregate retry rate this client adds
+        during an outage.
+
+        Returns:
+            True if a token was available (retry allowed)
+        """
+        with self._retry_lock:
+            now = time.monotonic()
+            self._retry_tokens = min(
+                float(self.options.max_retry_tokens),
+                self._retry_tokens
+                + (now - self._retry_refill_ts) * self.options.retry_refill_per_sec,
+            )
+            self._retry_refill_ts = now
+
+            if self._retry_tokens < 1.0:
+                return False
+            self._retry_tokens -= 1.0
+            return True
+
+    def _retry_delay_ms(self, attempt: int) -> float:
+        """
+        Compute backoff delay in milliseconds for a retry attempt.
+
+        Uses AWS-style full jitter by default: a uniform draw between 0
+        and the exponential ceiling. Deterministic doubling makes every
+        client retry at identical offsets, amplifying transient outages
+        into retry storms; randomizing decorrelates client wake-ups.
+
+        Args:
+            attempt: Current attempt number (0-indexed)
+
+        Returns:
+            Delay in milliseconds
+        """
+        ceiling = min(
+            self.options.max_backoff_ms,
+            self.options.initial_backoff_ms
+            * self.options.backoff_multiplier**attempt,
+        )
+        if self.options.jitter == "full":
+            return _rng.random() * ceiling
+        return ceiling
+
     def close(self) -> None:
-        """Close the gRPC channel."""
-        if self._channel:
-            self._channel.close()
-            self._channel = None
-            logger.info(f"gRPC channel to {self.target} closed")
+        """Close all pooled gRPC channels."""
+        if self._channels:
+            for channel in self._channels:
+                channel.close()
+            self._channels = []
+            logger.info(f"gRPC channels to {self.target} closed")
 
     def __enter__(self) -> GrpcClient:
         """Context manager entry."""
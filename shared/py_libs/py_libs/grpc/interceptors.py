@@ -4,33 +4,128 @@ gRPC security interceptors for authentication, rate limiting, and audit logging.
 
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
+import json
 import logging
 import time
-import traceback
 import uuid
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import OrderedDict
 from threading import Lock
 from typing import Any, Callable, Optional
 
 import grpc
 import jwt
 
+from ._ctx import correlation_id_var, jwt_payload_var, user_id_var
+
 logger = logging.getLogger(__name__)
 
 
+def _find_metadata(metadata: Any, *keys: str) -> list[Optional[str]]:
+    """
+    Scan invocation metadata once for specific keys.
+
+    Interceptors only ever read one or two known headers; building a full
+    dict per RPC allocates a hashmap and copies every metadata tuple for
+    entries that are never read. A single linear sweep avoids that.
+
+    Args:
+        metadata: Sequence of (key, value) metadata tuples
+        *keys: Metadata keys to look up
+
+    Returns:
+        Values in the same order as keys (None where absent)
+    """
+    values: list[Optional[str]] = [None] * len(keys)
+    if metadata:
+        for key, value in metadata:
+            for i, wanted in enumerate(keys):
+                if values[i] is None and key == wanted:
+                    values[i] = value
+    return values
+
+
+def _fast_jwt_sub(token: str) -> str:
+    """
+    Extract the 'sub' claim from a JWT without signature verification.
+
+    The rate limiter only needs an identity key, not a verified token,
+    so decoding the base64url payload directly avoids PyJWT's header
+    parsing and algorithm machinery on the per-RPC path.
+
+    Args:
+        token: Raw JWT string
+
+    Returns:
+        The 'sub' claim, or 'anonymous' if the token is malformed
+    """
+    try:
+        parts = token.split(".", 2)
+        if len(parts) < 2:
+            return "anonymous"
+        payload_b64 = parts[1]
+        padding = "=" * (-len(payload_b64) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64 + padding))
+        return payload.get("sub", "anonymous")
+    except Exception:
+        return "anonymous"
+
+
+def _noop_deser(x: Any) -> None:
+    """Drop the request body on abort paths; it is never read."""
+    return None
+
+
+def _noop_ser(x: Any) -> bytes:
+    """Serializer for abort handlers; unreachable since abort() raises."""
+    return b""
+
+
+@functools.lru_cache(maxsize=32)
+def _build_abort_handler(
+    code: grpc.StatusCode,
+    details: str,
+) -> grpc.RpcMethodHandler:
+    """
+    Build (and cache) an RPC handler that aborts with the given error.
+
+    Abort handlers are pure functions of (code, details); constructing a
+    fresh handler plus serializer lambdas per rejected request would
+    allocate four objects each time, which adds up under a rate-limit
+    flood.
+    """
+
+    def abort(request: Any, context: grpc.ServicerContext) -> None:
+        context.abort(code, details)
+
+    return grpc.unary_unary_rpc_method_handler(
+        abort,
+        request_deserializer=_noop_deser,
+        response_serializer=_noop_ser,
+    )
+
+
 class AuthInterceptor(grpc.ServerInterceptor):
     """
     JWT authentication interceptor for gRPC servers.
 
-    Validates JWT tokens in metadata and sets user context.
+    Validates JWT tokens in metadata and sets user context. Verified
+    payloads are memoized per token (LRU, TTL-bounded) so repeated calls
+    from the same client skip the signature crypto, which otherwise
+    dominates per-RPC auth cost.
     """
 
+    # How long a verified payload may be reused before re-verification
+    _CACHE_TTL_SECONDS = 60.0
+
     def __init__(
         self,
         secret_key: str,
         algorithms: Optional[list[str]] = None,
         public_methods: Optional[set[str]] = None,
+        cache_max: int = 4096,
     ):
         """
         Initialize auth interceptor.
@@ -39,10 +134,45 @@ class AuthInterceptor(grpc.ServerInterceptor):
             secret_key: JWT secret key for validation
             algorithms: List of allowed JWT algorithms (default: ['HS256'])
             public_methods: Set of method names that don't require auth
+            cache_max: Maximum number of verified tokens to memoize
         """
         self.secret_key = secret_key
         self.algorithms = algorithms or ["HS256"]
-        self.public_methods = public_methods or set()
+        # frozenset: membership test is the first check on every RPC
+        self.public_methods = frozenset(public_methods or ())
+        self.cache_max = cache_max
+        # Keyed by token digest (not the raw token) -> (verified_at, payload)
+        self._token_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._cache_lock = Lock()
+
+    def _cached_payload(self, cache_key: bytes) -> Optional[dict]:
+        """Return a still-valid cached payload for the token, if any."""
+        now = time.time()
+        with self._cache_lock:
+            entry = self._token_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            verified_at, payload = entry
+            if now - verified_at >= self._CACHE_TTL_SECONDS:
+                del self._token_cache[cache_key]
+                return None
+
+            exp = payload.get("exp")
+            if exp is not None and exp <= now:
+                del self._token_cache[cache_key]
+                return None
+
+            self._token_cache.move_to_end(cache_key)
+            return payload
+
+    def _cache_payload(self, cache_key: bytes, payload: dict) -> None:
+        """Memoize a freshly verified payload, evicting the oldest entry."""
+        with self._cache_lock:
+            self._token_cache[cache_key] = (time.time(), payload)
+            self._token_cache.move_to_end(cache_key)
+            while len(self._token_cache) > self.cache_max:
+                self._token_cache.popitem(last=False)
 
     def intercept_service(
         self,
@@ -57,77 +187,83 @@ class AuthInterceptor(grpc.ServerInterceptor):
             return continuation(handler_call_details)
 
         # Extract token from metadata
-        metadata = dict(handler_call_details.invocation_metadata)
-        auth_header = metadata.get("authorization", "")
+        (auth_header,) = _find_metadata(
+            handler_call_details.invocation_metadata, "authorization"
+        )
+        auth_header = auth_header or ""
 
         if not auth_header.startswith("Bearer "):
             logger.warning(f"Missing or invalid auth header for {method}")
-            return self._abort_with_error(
+            return _build_abort_handler(
                 grpc.StatusCode.UNAUTHENTICATED,
                 "Missing or invalid authorization header",
             )
 
         token = auth_header[7:]  # Remove 'Bearer ' prefix
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
 
         try:
-            # Validate JWT token
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=self.algorithms,
-            )
+            # Reuse a recently verified payload if available
+            payload = self._cached_payload(cache_key)
+            if payload is None:
+                # Validate JWT token
+                payload = jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=self.algorithms,
+                )
+                self._cache_payload(cache_key, payload)
 
             # Add user info to context (can be retrieved in handlers)
             user_id = payload.get("sub")
-            logger.info(
-                f"Authenticated request to {method}", extra={"user_id": user_id}
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Authenticated request to {method}", extra={"user_id": user_id}
+                )
 
-            return continuation(handler_call_details)
+            # Expose the user id and decoded payload to downstream
+            # interceptors (e.g. RateLimitInterceptor) for the rest of
+            # the chain so they don't parse the same token again. Both
+            # vars are reset afterwards so a later RPC on the same
+            # thread that skips auth can't read a stale caller's state
+            user_id_token = user_id_var.set(user_id)
+            payload_token = jwt_payload_var.set(payload)
+            try:
+                return continuation(handler_call_details)
+            finally:
+                jwt_payload_var.reset(payload_token)
+                user_id_var.reset(user_id_token)
 
         except jwt.ExpiredSignatureError:
             logger.warning(f"Expired token for {method}")
-            return self._abort_with_error(
+            return _build_abort_handler(
                 grpc.StatusCode.UNAUTHENTICATED, "Token has expired"
             )
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token for {method}: {e}")
-            return self._abort_with_error(
+            return _build_abort_handler(
                 grpc.StatusCode.UNAUTHENTICATED, "Invalid token"
             )
 
-    def _abort_with_error(
-        self,
-        code: grpc.StatusCode,
-        details: str,
-    ) -> grpc.RpcMethodHandler:
-        """Return an RPC handler that aborts with error."""
-
-        def abort(request: Any, context: grpc.ServicerContext) -> None:
-            context.abort(code, details)
-
-        return grpc.unary_unary_rpc_method_handler(
-            abort,
-            request_deserializer=lambda x: x,
-            response_serializer=lambda x: x,
-        )
-
-
-@dataclass(slots=True)
-class RateLimitEntry:
-    """Track rate limit for a client."""
-
-    count: int = 0
-    window_start: float = 0.0
-
 
 class RateLimitInterceptor(grpc.ServerInterceptor):
     """
     Rate limiting interceptor with per-client limits.
 
-    Implements sliding window rate limiting.
+    Implements approximate fixed-window rate limiting over a fixed-size
+    counter table. Each client hashes to one of 65536 slots holding a
+    (window_start_ns, count) pair, so memory stays O(table size) no
+    matter how many distinct clients appear — an unbounded per-client
+    dict would grow forever under anonymous/per-IP traffic. Clients that
+    collide on a slot share its counter, so limiting is approximate
+    (colliding clients may be throttled slightly early). Slot locks are
+    sharded so concurrent RPCs from different clients do not serialize
+    on one global lock.
     """
 
+    _SHARD_COUNT = 16  # Power of two so the shard index is a cheap mask
+    _SLOT_COUNT = 65536  # One slot per 16-bit client hash
+
     def __init__(
         self,
         requests_per_minute: int = 100,
@@ -142,8 +278,14 @@ class RateLimitInterceptor(grpc.ServerInterceptor):
         """
         self.requests_per_minute = requests_per_minute
         self.per_user = per_user
-        self.limits: dict[str, RateLimitEntry] = defaultdict(RateLimitEntry)
-        self.lock = Lock()
+        # Flat table of ints, each packing (window_start_seconds << 20)
+        # | count. One small int per slot is cheaper than a per-slot
+        # list or dataclass: no per-client allocation, and the window
+        # check and increment are plain integer arithmetic on one word.
+        # Counts fit in 20 bits (~1M), far above any sane per-minute
+        # limit.
+        self._slots: list[int] = [0] * self._SLOT_COUNT
+        self._shard_locks = [Lock() for _ in range(self._SHARD_COUNT)]
 
     def intercept_service(
         self,
@@ -152,68 +294,122 @@ class RateLimitInterceptor(grpc.ServerInterceptor):
     ) -> grpc.RpcMethodHandler:
         """Intercept and check rate limits."""
         # Determine client identifier
-        metadata = dict(handler_call_details.invocation_metadata)
+        auth_header, forwarded_for = _find_metadata(
+            handler_call_details.invocation_metadata,
+            "authorization",
+            "x-forwarded-for",
+        )
 
         if self.per_user:
-            # Extract user from token
-            auth_header = metadata.get("authorization", "")
-            if auth_header.startswith("Bearer "):
-                try:
-                    token = auth_header[7:]
-                    payload = jwt.decode(token, options={"verify_signature": False})
-                    client_id = payload.get("sub", "anonymous")
-                except Exception:
-                    client_id = "anonymous"
+            # Reuse the payload AuthInterceptor already decoded when it
+            # runs earlier in the chain; otherwise fall back to a raw
+            # (unverified) parse — keying doesn't need verification
+            payload = jwt_payload_var.get()
+            if payload is not None:
+                client_id = payload.get("sub", "anonymous")
             else:
-                client_id = "anonymous"
+                auth_header = auth_header or ""
+                if auth_header.startswith("Bearer "):
+                    client_id = _fast_jwt_sub(auth_header[7:])
+                else:
+                    client_id = "anonymous"
         else:
             # Use peer address (IP)
-            client_id = metadata.get("x-forwarded-for", "unknown")
-
-        # Check rate limit
-        current_time = time.time()
+            client_id = forwarded_for or "unknown"
+
+        # Check rate limit. Monotonic time is immune to wall-clock steps
+        # (NTP slews would otherwise shrink or stretch windows); second
+        # resolution is plenty for 60s windows.
+        current_s = time.monotonic_ns() // 1_000_000_000
+        # Stable 16-bit hash: process-local hash() is salted per run,
+        # which would reshuffle slots (and drop counters) on restart
+        idx = int.from_bytes(
+            hashlib.blake2b(client_id.encode(), digest_size=2).digest(), "little"
+        )
 
-        with self.lock:
-            entry = self.limits[client_id]
+        with self._shard_locks[idx & (self._SHARD_COUNT - 1)]:
+            packed = self._slots[idx]
+            window_start = packed >> 20
+            count = packed & 0xFFFFF
 
             # Reset window if expired
-            if current_time - entry.window_start >= 60.0:
-                entry.count = 0
-                entry.window_start = current_time
+            if current_s - window_start >= 60:
+                window_start = current_s
+                count = 0
 
             # Check limit
-            if entry.count >= self.requests_per_minute:
+            if count >= self.requests_per_minute:
                 logger.warning(
                     f"Rate limit exceeded for {client_id}",
                     extra={
                         "client_id": client_id,
-                        "requests": entry.count,
+                        "requests": count,
                     },
                 )
-                return self._abort_with_error(
+                return _build_abort_handler(
                     grpc.StatusCode.RESOURCE_EXHAUSTED, "Rate limit exceeded"
                 )
 
-            # Increment counter
-            entry.count += 1
+            # Increment counter and write back the packed word
+            self._slots[idx] = ((window_start << 20) | (count + 1))
 
         return continuation(handler_call_details)
 
-    def _abort_with_error(
-        self,
-        code: grpc.StatusCode,
-        details: str,
-    ) -> grpc.RpcMethodHandler:
-        """Return an RPC handler that aborts with error."""
 
-        def abort(request: Any, context: grpc.ServicerContext) -> None:
-            context.abort(code, details)
+def _audit_unary(
+    method: str,
+    start_ns: int,
+    original_handler: Callable[[Any, grpc.ServicerContext], Any],
+    request: Any,
+    context: grpc.ServicerContext,
+) -> Any:
+    """Unary handler body for AuditInterceptor (bound via partial)."""
+    # Set by CorrelationInterceptor; avoids re-scanning metadata
+    correlation_id = correlation_id_var.get()
+
+    # Guard before building the message and extra dict; INFO is
+    # commonly disabled in production and the formatting would
+    # otherwise run on every RPC regardless
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    if info_enabled:
+        logger.info(
+            f"gRPC request started: {method}",
+            extra={
+                "method": method,
+                "correlation_id": correlation_id,
+            },
+        )
+
+    try:
+        response = original_handler(request, context)
 
-        return grpc.unary_unary_rpc_method_handler(
-            abort,
-            request_deserializer=lambda x: x,
-            response_serializer=lambda x: x,
+        if info_enabled:
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            logger.info(
+                f"gRPC request completed: {method}",
+                extra={
+                    "method": method,
+                    "duration_ms": duration_ms,
+                    "correlation_id": correlation_id,
+                    "status": "OK",
+                },
+            )
+        return response
+
+    except Exception as e:
+        duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+
+        logger.error(
+            f"gRPC request failed: {method}",
+            extra={
+                "method": method,
+                "duration_ms": duration_ms,
+                "correlation_id": correlation_id,
+                "error": str(e),
+            },
+            exc_info=True,
         )
+        raise
 
 
 class AuditInterceptor(grpc.ServerInterceptor):
@@ -229,13 +425,93 @@ class AuditInterceptor(grpc.ServerInterceptor):
         handler_call_details: grpc.HandlerCallDetails,
     ) -> grpc.RpcMethodHandler:
         """Intercept and log requests."""
-        method = handler_call_details.method
-        start_time = time.time()
+        handler = continuation(handler_call_details)
+
+        # Streaming methods pass through unchanged
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        # functools.partial binds in C without a per-RPC closure frame
+        return grpc.unary_unary_rpc_method_handler(
+            functools.partial(
+                _audit_unary,
+                handler_call_details.method,
+                time.monotonic_ns(),
+                handler.unary_unary,
+            ),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+def _correlation_unary(
+    correlation_id: str,
+    original_handler: Callable[[Any, grpc.ServicerContext], Any],
+    request: Any,
+    context: grpc.ServicerContext,
+) -> Any:
+    """Unary handler body for CorrelationInterceptor (bound via partial)."""
+    token = correlation_id_var.set(correlation_id)
+    try:
+        return original_handler(request, context)
+    finally:
+        correlation_id_var.reset(token)
+
+
+class CorrelationInterceptor(grpc.ServerInterceptor):
+    """
+    Correlation ID interceptor for request tracing.
+
+    Adds or propagates correlation IDs across service calls. The ID is
+    published via a ContextVar for the duration of the handler so other
+    interceptors and handlers read it without re-scanning metadata.
+    Register this interceptor before AuditInterceptor so the context is
+    set when the audit wrapper runs.
+    """
+
+    def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """Intercept and add correlation ID."""
+        # Get or create correlation ID
+        (correlation_id,) = _find_metadata(
+            handler_call_details.invocation_metadata, "x-correlation-id"
+        )
+        if not correlation_id:
+            correlation_id = str(uuid.uuid4())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Generated new correlation ID: {correlation_id}")
+
+        handler = continuation(handler_call_details)
+
+        # Streaming methods pass through unchanged
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        # Wrap handler so the ContextVar is set for the handler's duration
+        return grpc.unary_unary_rpc_method_handler(
+            functools.partial(
+                _correlation_unary, correlation_id, handler.unary_unary
+            ),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
 
-        # Get correlation ID from metadata
-        metadata = dict(handler_call_details.invocation_metadata)
-        correlation_id = metadata.get("x-correlation-id", "unknown")
 
+def _fused_unary(
+    method: str,
+    start_ns: int,
+    correlation_id: str,
+    original_handler: Callable[[Any, grpc.ServicerContext], Any],
+    request: Any,
+    context: grpc.ServicerContext,
+) -> Any:
+    """Unary handler body for ObservabilityInterceptor (bound via partial)."""
+    token = correlation_id_var.set(correlation_id)
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    if info_enabled:
         logger.info(
             f"gRPC request started: {method}",
             extra={
@@ -243,58 +519,64 @@ class AuditInterceptor(grpc.ServerInterceptor):
                 "correlation_id": correlation_id,
             },
         )
+    try:
+        response = original_handler(request, context)
+        if info_enabled:
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            logger.info(
+                f"gRPC request completed: {method}",
+                extra={
+                    "method": method,
+                    "duration_ms": duration_ms,
+                    "correlation_id": correlation_id,
+                    "status": "OK",
+                },
+            )
+        return response
 
-        handler = continuation(handler_call_details)
+    except grpc.RpcError:
+        # Let gRPC errors pass through
+        raise
 
-        # Wrap handler to log completion
-        if handler and handler.unary_unary:
-            original_handler = handler.unary_unary
-
-            def logged_handler(request: Any, context: grpc.ServicerContext) -> Any:
-                try:
-                    response = original_handler(request, context)
-                    duration_ms = (time.time() - start_time) * 1000
-
-                    logger.info(
-                        f"gRPC request completed: {method}",
-                        extra={
-                            "method": method,
-                            "duration_ms": duration_ms,
-                            "correlation_id": correlation_id,
-                            "status": "OK",
-                        },
-                    )
-                    return response
-
-                except Exception as e:
-                    duration_ms = (time.time() - start_time) * 1000
-
-                    logger.error(
-                        f"gRPC request failed: {method}",
-                        extra={
-                            "method": method,
-                            "duration_ms": duration_ms,
-                            "correlation_id": correlation_id,
-                            "error": str(e),
-                        },
-                        exc_info=True,
-                    )
-                    raise
-
-            return grpc.unary_unary_rpc_method_handler(
-                logged_handler,
-                request_deserializer=handler.request_deserializer,
-                response_serializer=handler.response_serializer,
-            )
+    except Exception as e:
+        duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+        logger.error(
+            f"gRPC request failed: {method}",
+            extra={
+                "method": method,
+                "duration_ms": duration_ms,
+                "correlation_id": correlation_id,
+                "error": str(e),
+            },
+            exc_info=True,
+        )
+        context.abort(
+            grpc.StatusCode.INTERNAL, f"Internal server error: {str(e)}"
+        )
 
-        return handler
+    finally:
+        correlation_id_var.reset(token)
 
 
-class CorrelationInterceptor(grpc.ServerInterceptor):
+class ObservabilityInterceptor(grpc.ServerInterceptor):
     """
-    Correlation ID interceptor for request tracing.
-
-    Adds or propagates correlation IDs across service calls.
+    Fused correlation + audit + recovery interceptor.
+
+    Registering CorrelationInterceptor, AuditInterceptor, and
+    RecoveryInterceptor separately wraps every handler three times:
+    three handler objects, three closure frames, and three serializer
+    references per RPC. Their logic composes trivially, so this
+    interceptor performs one metadata scan and builds one wrapped
+    handler that sets the correlation ContextVar, emits audit logs with
+    durations, and converts unexpected exceptions to INTERNAL errors.
+
+    Use in place of the three individual interceptors:
+
+        >>> interceptors = [
+        >>>     AuthInterceptor(secret),
+        >>>     RateLimitInterceptor(),
+        >>>     ObservabilityInterceptor(),
+        >>> ]
     """
 
     def intercept_service(
@@ -302,19 +584,62 @@ class CorrelationInterceptor(grpc.ServerInterceptor):
         continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
         handler_call_details: grpc.HandlerCallDetails,
     ) -> grpc.RpcMethodHandler:
-        """Intercept and add correlation ID."""
-        metadata = dict(handler_call_details.invocation_metadata)
+        """Intercept with fused correlation, audit, and recovery."""
+        method = handler_call_details.method
+        start_ns = time.monotonic_ns()
 
-        # Get or create correlation ID
-        correlation_id = metadata.get("x-correlation-id")
+        (correlation_id,) = _find_metadata(
+            handler_call_details.invocation_metadata, "x-correlation-id"
+        )
         if not correlation_id:
             correlation_id = str(uuid.uuid4())
-            logger.debug(f"Generated new correlation ID: {correlation_id}")
 
-        # Store in context for handlers to access
-        # (This would typically use contextvars in production)
+        handler = continuation(handler_call_details)
 
-        return continuation(handler_call_details)
+        # Streaming methods pass through unchanged
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        return grpc.unary_unary_rpc_method_handler(
+            functools.partial(
+                _fused_unary, method, start_ns, correlation_id, handler.unary_unary
+            ),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+def _recovery_unary(
+    method: str,
+    original_handler: Callable[[Any, grpc.ServicerContext], Any],
+    request: Any,
+    context: grpc.ServicerContext,
+) -> Any:
+    """Unary handler body for RecoveryInterceptor (bound via partial)."""
+    try:
+        return original_handler(request, context)
+
+    except grpc.RpcError:
+        # Let gRPC errors pass through
+        raise
+
+    except Exception as e:
+        # Convert unexpected exceptions to gRPC errors. exc_info=True
+        # defers traceback formatting to the logging framework (and only
+        # if the record is emitted); format_exc() here would walk and
+        # render the stack eagerly on every exception.
+        logger.error(
+            f"Unexpected error in {method}",
+            extra={
+                "method": method,
+                "error": str(e),
+            },
+            exc_info=True,
+        )
+
+        context.abort(
+            grpc.StatusCode.INTERNAL, f"Internal server error: {str(e)}"
+        )
 
 
 class RecoveryInterceptor(grpc.ServerInterceptor):
@@ -332,40 +657,14 @@ class RecoveryInterceptor(grpc.ServerInterceptor):
         """Intercept and handle exceptions."""
         handler = continuation(handler_call_details)
 
-        if handler and handler.unary_unary:
-            original_handler = handler.unary_unary
-
-            def recovery_handler(request: Any, context: grpc.ServicerContext) -> Any:
-                try:
-                    return original_handler(request, context)
-
-                except grpc.RpcError:
-                    # Let gRPC errors pass through
-                    raise
-
-                except Exception as e:
-                    # Convert unexpected exceptions to gRPC errors
-                    method = handler_call_details.method
-                    error_trace = traceback.format_exc()
-
-                    logger.error(
-                        f"Unexpected error in {method}",
-                        extra={
-                            "method": method,
-                            "error": str(e),
-                            "trace": error_trace,
-                        },
-                        exc_info=True,
-                    )
-
-                    context.abort(
-                        grpc.StatusCode.INTERNAL, f"Internal server error: {str(e)}"
-                    )
-
-            return grpc.unary_unary_rpc_method_handler(
-                recovery_handler,
-                request_deserializer=handler.request_deserializer,
-                response_serializer=handler.response_serializer,
-            )
+        # Streaming methods pass through unchanged
+        if handler is None or handler.unary_unary is None:
+            return handler
 
-        return handler
+        return grpc.unary_unary_rpc_method_handler(
+            functools.partial(
+                _recovery_unary, handler_call_details.method, handler.unary_unary
+            ),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
@@ -7,6 +7,7 @@ Provides:
 """
 
 from .client import (
+    AsyncHTTPClient,
     CircuitBreakerConfig,
     CircuitState,
     HTTPClient,
@@ -26,6 +27,7 @@ __all__ = [
     "get_correlation_id",
     # HTTP client
     "HTTPClient",
+    "AsyncHTTPClient",
     "HTTPClientConfig",
     "RetryConfig",
     "CircuitBreakerConfig",
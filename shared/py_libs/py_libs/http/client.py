@@ -5,11 +5,14 @@ Provides a production-ready HTTP client with exponential backoff,
 configurable timeouts, and optional circuit breaker protection.
 """
 
+import asyncio
 import logging
+import random
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -57,6 +60,22 @@ class CircuitBreakerState:
     last_failure_time: float = 0.0
 
 
+def _default_limits() -> httpx.Limits:
+    """Default connection-pool limits.
+
+    httpx's stock 5s keepalive expiry closes connections between
+    typical 10-30s poll intervals, forcing a TCP+TLS handshake per
+    request; 15s keeps them warm. Pool caps are raised so retry loops
+    and fan-out against the same host reuse connections instead of
+    reconnecting.
+    """
+    return httpx.Limits(
+        max_connections=1000,
+        max_keepalive_connections=100,
+        keepalive_expiry=15.0,
+    )
+
+
 @dataclass(slots=True)
 class HTTPClientConfig:
     """Configuration for HTTP client."""
@@ -67,57 +86,53 @@ class HTTPClientConfig:
     headers: Dict[str, str] = field(default_factory=dict)
     follow_redirects: bool = True
     verify_ssl: bool = True
+    limits: httpx.Limits = field(default_factory=_default_limits)
+    # HTTP/2 multiplexes concurrent requests to one host over a single
+    # TLS connection (pipelining's latency win without its head-of-line
+    # problems); the http extra ships httpx[http2] so h2 is available
+    http2: bool = True
 
 
-class HTTPClient:
+class _HTTPClientBase:
     """
-    Production-ready HTTP client with retries and circuit breaker.
-
-    Features:
-    - Exponential backoff with jitter
-    - Configurable timeouts
-    - Request/response logging
-    - Correlation ID propagation
-    - Optional circuit breaker pattern
-
-    Example:
-        config = HTTPClientConfig(
-            timeout=30.0,
-            retry=RetryConfig(max_retries=3, base_delay=1.0)
-        )
-        client = HTTPClient(config)
+    Shared configuration, retry-delay, and circuit-breaker logic.
 
-        response = client.get("https://api.example.com/users")
-        data = response.json()
+    The sync HTTPClient and AsyncHTTPClient differ only in transport
+    (httpx.Client vs httpx.AsyncClient) and how they sleep between
+    retries; everything else lives here.
     """
 
     def __init__(self, config: Optional[HTTPClientConfig] = None) -> None:
         """
-        Initialize HTTP client.
+        Initialize shared client state.
 
         Args:
             config: Client configuration (uses defaults if None)
         """
         self.config = config or HTTPClientConfig()
         self._circuit_state = CircuitBreakerState()
-        self._client = httpx.Client(
-            timeout=self.config.timeout,
-            follow_redirects=self.config.follow_redirects,
-            verify=self.config.verify_ssl,
+        # Guards circuit-breaker transitions; held only for the few
+        # reads/writes of a transition so a client shared across
+        # threads (or gather() fan-out) sees consistent state
+        self._circuit_lock = threading.Lock()
+
+        # Snapshot the configured headers once; most requests pass no
+        # per-call headers and can share this dict instead of copying
+        # it per request
+        self._base_headers = dict(self.config.headers)
+
+        # Retry config is immutable for the client's lifetime, so the
+        # capped exponential schedule is computed once here instead of
+        # re-exponentiating on every failed attempt
+        retry = self.config.retry
+        self._delay_schedule = tuple(
+            min(
+                retry.base_delay * retry.exponential_base**attempt,
+                retry.max_delay,
+            )
+            for attempt in range(retry.max_retries + 1)
         )
 
-    def __enter__(self) -> "HTTPClient":
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._client.close()
-
     def _calculate_delay(self, attempt: int) -> float:
         """
         Calculate delay for exponential backoff.
@@ -128,15 +143,9 @@ class HTTPClient:
         Returns:
             float: Delay in seconds
         """
-        delay = min(
-            self.config.retry.base_delay
-            * (self.config.retry.exponential_base**attempt),
-            self.config.retry.max_delay,
-        )
+        delay = self._delay_schedule[attempt]
 
         if self.config.retry.jitter:
-            import random
-
             delay *= 0.5 + random.random()  # Add jitter (50-150% of base)
 
         return delay
@@ -151,57 +160,68 @@ class HTTPClient:
         if not self.config.circuit_breaker.enabled:
             return
 
-        now = time.time()
-
-        if self._circuit_state.state == CircuitState.OPEN:
-            elapsed = now - self._circuit_state.last_failure_time
-            if elapsed >= self.config.circuit_breaker.timeout:
-                logger.info("Circuit breaker entering HALF_OPEN state")
-                self._circuit_state.state = CircuitState.HALF_OPEN
-                self._circuit_state.success_count = 0
-            else:
-                raise httpx.HTTPError(
-                    f"Circuit breaker is OPEN (retry after {self.config.circuit_breaker.timeout - elapsed:.1f}s)"
-                )
+        # Monotonic: immune to wall-clock jumps (NTP, DST) that would
+        # otherwise corrupt the open-window arithmetic
+        now = time.monotonic()
+        retry_after = 0.0
+
+        with self._circuit_lock:
+            if self._circuit_state.state == CircuitState.OPEN:
+                elapsed = now - self._circuit_state.last_failure_time
+                if elapsed >= self.config.circuit_breaker.timeout:
+                    logger.info("Circuit breaker entering HALF_OPEN state")
+                    self._circuit_state.state = CircuitState.HALF_OPEN
+                    self._circuit_state.success_count = 0
+                else:
+                    retry_after = self.config.circuit_breaker.timeout - elapsed
+
+        if retry_after:
+            raise httpx.HTTPError(
+                f"Circuit breaker is OPEN (retry after {retry_after:.1f}s)"
+            )
 
     def _record_success(self) -> None:
         """Record successful request for circuit breaker."""
         if not self.config.circuit_breaker.enabled:
             return
 
-        if self._circuit_state.state == CircuitState.HALF_OPEN:
-            self._circuit_state.success_count += 1
-            if (
-                self._circuit_state.success_count
-                >= self.config.circuit_breaker.success_threshold
-            ):
-                logger.info("Circuit breaker closing after successful requests")
-                self._circuit_state.state = CircuitState.CLOSED
+        with self._circuit_lock:
+            if self._circuit_state.state == CircuitState.HALF_OPEN:
+                self._circuit_state.success_count += 1
+                if (
+                    self._circuit_state.success_count
+                    >= self.config.circuit_breaker.success_threshold
+                ):
+                    logger.info("Circuit breaker closing after successful requests")
+                    self._circuit_state.state = CircuitState.CLOSED
+                    self._circuit_state.failure_count = 0
+            elif self._circuit_state.state == CircuitState.CLOSED:
                 self._circuit_state.failure_count = 0
-        elif self._circuit_state.state == CircuitState.CLOSED:
-            self._circuit_state.failure_count = 0
 
     def _record_failure(self) -> None:
         """Record failed request for circuit breaker."""
         if not self.config.circuit_breaker.enabled:
             return
 
-        self._circuit_state.last_failure_time = time.time()
-
-        if self._circuit_state.state == CircuitState.HALF_OPEN:
-            logger.warning("Circuit breaker opening after failure in HALF_OPEN state")
-            self._circuit_state.state = CircuitState.OPEN
-            self._circuit_state.failure_count = 0
-        elif self._circuit_state.state == CircuitState.CLOSED:
-            self._circuit_state.failure_count += 1
-            if (
-                self._circuit_state.failure_count
-                >= self.config.circuit_breaker.failure_threshold
-            ):
+        with self._circuit_lock:
+            self._circuit_state.last_failure_time = time.monotonic()
+
+            if self._circuit_state.state == CircuitState.HALF_OPEN:
                 logger.warning(
-                    f"Circuit breaker opening after {self._circuit_state.failure_count} failures"
+                    "Circuit breaker opening after failure in HALF_OPEN state"
                 )
                 self._circuit_state.state = CircuitState.OPEN
+                self._circuit_state.failure_count = 0
+            elif self._circuit_state.state == CircuitState.CLOSED:
+                self._circuit_state.failure_count += 1
+                if (
+                    self._circuit_state.failure_count
+                    >= self.config.circuit_breaker.failure_threshold
+                ):
+                    logger.warning(
+                        f"Circuit breaker opening after {self._circuit_state.failure_count} failures"
+                    )
+                    self._circuit_state.state = CircuitState.OPEN
 
     def _prepare_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
         """
@@ -213,18 +233,89 @@ class HTTPClient:
         Returns:
             Dict[str, str]: Combined headers
         """
-        combined = dict(self.config.headers)
-        if headers:
-            combined.update(headers)
+        correlation_id = get_correlation_id()
+
+        if not headers:
+            # Hot path: no per-call headers. Reuse the shared snapshot
+            # outright, or extend it with the correlation ID in a
+            # single dict display
+            base = self._base_headers
+            if not correlation_id or "X-Correlation-ID" in base:
+                return base
+            return {
+                **base,
+                "X-Correlation-ID": correlation_id,
+                "X-Request-ID": correlation_id,
+            }
+
+        combined = {**self._base_headers, **headers}
 
         # Add correlation ID if available
-        correlation_id = get_correlation_id()
         if correlation_id and "X-Correlation-ID" not in combined:
             combined["X-Correlation-ID"] = correlation_id
             combined["X-Request-ID"] = correlation_id
 
         return combined
 
+    def _should_raise_without_retry(self, exc: Exception) -> bool:
+        """Whether an error is a non-retryable client error (4xx != 429)."""
+        return (
+            isinstance(exc, httpx.HTTPStatusError)
+            and 400 <= exc.response.status_code < 500
+            and exc.response.status_code != 429
+        )
+
+
+class HTTPClient(_HTTPClientBase):
+    """
+    Production-ready HTTP client with retries and circuit breaker.
+
+    Features:
+    - Exponential backoff with jitter
+    - Configurable timeouts
+    - Request/response logging
+    - Correlation ID propagation
+    - Optional circuit breaker pattern
+
+    Example:
+        config = HTTPClientConfig(
+            timeout=30.0,
+            retry=RetryConfig(max_retries=3, base_delay=1.0)
+        )
+        client = HTTPClient(config)
+
+        response = client.get("https://api.example.com/users")
+        data = response.json()
+    """
+
+    def __init__(self, config: Optional[HTTPClientConfig] = None) -> None:
+        """
+        Initialize HTTP client.
+
+        Args:
+            config: Client configuration (uses defaults if None)
+        """
+        super().__init__(config)
+        self._client = httpx.Client(
+            timeout=self.config.timeout,
+            follow_redirects=self.config.follow_redirects,
+            verify=self.config.verify_ssl,
+            limits=self.config.limits,
+            http2=self.config.http2,
+        )
+
+    def __enter__(self) -> "HTTPClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._client.close()
+
     def _request_with_retry(
         self,
         method: str,
@@ -247,24 +338,36 @@ class HTTPClient:
         """
         self._check_circuit_breaker()
 
-        # Prepare headers
+        # Prepare headers; on the bare-call fast path (nothing
+        # configured, nothing passed, no correlation ID) leave kwargs
+        # alone so httpx's defaults apply unmodified
         headers = self._prepare_headers(kwargs.get("headers"))
-        kwargs["headers"] = headers
+        if headers:
+            kwargs["headers"] = headers
 
         last_exception: Optional[Exception] = None
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        for attempt in range(self.config.retry.max_retries + 1):
+        # Hoist chained attribute lookups out of the retry loop
+        max_retries = self.config.retry.max_retries
+        client_request = self._client.request
+
+        for attempt in range(max_retries + 1):
             try:
-                logger.debug(
-                    f"HTTP {method} {url} (attempt {attempt + 1}/{self.config.retry.max_retries + 1})"
-                )
+                if debug_enabled:
+                    logger.debug(
+                        f"HTTP {method} {url} (attempt {attempt + 1}/{max_retries + 1})"
+                    )
 
-                response = self._client.request(method, url, **kwargs)
+                response = client_request(method, url, **kwargs)
                 response.raise_for_status()
 
-                logger.debug(
-                    f"HTTP {method} {url} -> {response.status_code} ({len(response.content)} bytes)"
-                )
+                if debug_enabled:
+                    # num_bytes_downloaded doesn't force the body into
+                    # memory the way response.content does
+                    logger.debug(
+                        f"HTTP {method} {url} -> {response.status_code} ({response.num_bytes_downloaded} bytes)"
+                    )
 
                 self._record_success()
                 return response
@@ -275,18 +378,16 @@ class HTTPClient:
                     f"HTTP {method} {url} failed (attempt {attempt + 1}): {e}"
                 )
 
-                self._record_failure()
+                # Client errors (4xx except 429) are caller bugs, not
+                # upstream degradation: raise before they count toward
+                # opening the circuit breaker
+                if self._should_raise_without_retry(e):
+                    raise
 
-                # Don't retry on client errors (4xx) except 429 (rate limit)
-                if isinstance(e, httpx.HTTPStatusError):
-                    if (
-                        400 <= e.response.status_code < 500
-                        and e.response.status_code != 429
-                    ):
-                        raise
+                self._record_failure()
 
                 # If this was the last attempt, raise
-                if attempt >= self.config.retry.max_retries:
+                if attempt >= max_retries:
                     raise
 
                 # Calculate and apply delay
@@ -326,3 +427,181 @@ class HTTPClient:
     def options(self, url: str, **kwargs: Any) -> httpx.Response:
         """Execute OPTIONS request with retry logic."""
         return self._request_with_retry("OPTIONS", url, **kwargs)
+
+
+class AsyncHTTPClient(_HTTPClientBase):
+    """
+    Async sibling of HTTPClient sharing one httpx.AsyncClient.
+
+    Independent requests overlap on the event loop instead of
+    serializing one RTT at a time, while the shared client reuses the
+    connection pool and TLS state across concurrent calls.
+
+    Example:
+        async with AsyncHTTPClient() as client:
+            users, orders = await client.gather([
+                ("GET", "https://api.example.com/users", {}),
+                ("GET", "https://api.example.com/orders", {}),
+            ])
+    """
+
+    def __init__(self, config: Optional[HTTPClientConfig] = None) -> None:
+        """
+        Initialize async HTTP client.
+
+        Args:
+            config: Client configuration (uses defaults if None)
+        """
+        super().__init__(config)
+        self._client = httpx.AsyncClient(
+            timeout=self.config.timeout,
+            follow_redirects=self.config.follow_redirects,
+            verify=self.config.verify_ssl,
+            limits=self.config.limits,
+            http2=self.config.http2,
+        )
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Execute HTTP request with retry logic.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            **kwargs: Additional arguments for httpx request
+
+        Returns:
+            httpx.Response: HTTP response
+
+        Raises:
+            HTTPError: If all retries exhausted or circuit breaker open
+        """
+        self._check_circuit_breaker()
+
+        # Prepare headers; on the bare-call fast path (nothing
+        # configured, nothing passed, no correlation ID) leave kwargs
+        # alone so httpx's defaults apply unmodified
+        headers = self._prepare_headers(kwargs.get("headers"))
+        if headers:
+            kwargs["headers"] = headers
+
+        last_exception: Optional[Exception] = None
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Hoist chained attribute lookups out of the retry loop
+        max_retries = self.config.retry.max_retries
+        client_request = self._client.request
+
+        for attempt in range(max_retries + 1):
+            try:
+                if debug_enabled:
+                    logger.debug(
+                        f"HTTP {method} {url} (attempt {attempt + 1}/{max_retries + 1})"
+                    )
+
+                response = await client_request(method, url, **kwargs)
+                response.raise_for_status()
+
+                if debug_enabled:
+                    # num_bytes_downloaded doesn't force the body into
+                    # memory the way response.content does
+                    logger.debug(
+                        f"HTTP {method} {url} -> {response.status_code} ({response.num_bytes_downloaded} bytes)"
+                    )
+
+                self._record_success()
+                return response
+
+            except (httpx.HTTPError, httpx.RequestError) as e:
+                last_exception = e
+                logger.warning(
+                    f"HTTP {method} {url} failed (attempt {attempt + 1}): {e}"
+                )
+
+                # Client errors (4xx except 429) are caller bugs, not
+                # upstream degradation: raise before they count toward
+                # opening the circuit breaker
+                if self._should_raise_without_retry(e):
+                    raise
+
+                self._record_failure()
+
+                # If this was the last attempt, raise
+                if attempt >= max_retries:
+                    raise
+
+                # Calculate and apply delay without blocking the loop
+                delay = self._calculate_delay(attempt)
+                logger.info(f"Retrying in {delay:.2f}s...")
+                await asyncio.sleep(delay)
+
+        # Should never reach here, but satisfy type checker
+        if last_exception:
+            raise last_exception
+        raise httpx.HTTPError("Request failed with no exception")
+
+    async def gather(
+        self, requests: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[httpx.Response]:
+        """
+        Execute many requests concurrently on the shared client.
+
+        Args:
+            requests: List of (method, url, kwargs) tuples
+
+        Returns:
+            list[httpx.Response]: Responses in request order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self._request_with_retry(method, url, **kwargs)
+                    for method, url, kwargs in requests
+                )
+            )
+        )
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute GET request with retry logic."""
+        return await self._request_with_retry("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute POST request with retry logic."""
+        return await self._request_with_retry("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute PUT request with retry logic."""
+        return await self._request_with_retry("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute PATCH request with retry logic."""
+        return await self._request_with_retry("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute DELETE request with retry logic."""
+        return await self._request_with_retry("DELETE", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute HEAD request with retry logic."""
+        return await self._request_with_retry("HEAD", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Execute OPTIONS request with retry logic."""
+        return await self._request_with_retry("OPTIONS", url, **kwargs)
@@ -20,25 +20,26 @@ def generate_correlation_id() -> str:
     Generate a new correlation ID using UUID4.
 
     Returns:
-        str: A new UUID4 string suitable for correlation tracking
+        str: A new 32-character hex string suitable for correlation
+            tracking
     """
-    return str(uuid.uuid4())
+    # .hex skips str(uuid4())'s hyphenated formatting pass and the ID
+    # is 4 bytes shorter on the wire in every request/response header
+    return uuid.uuid4().hex
 
 
 def get_correlation_id() -> Optional[str]:
     """
     Get the current correlation ID from context.
 
+    The ContextVar is the single source of truth: it works in sync,
+    threaded, and async contexts alike, and reading it is one C-level
+    call versus going through Flask's request-context proxy for g.
+
     Returns:
         Optional[str]: Current correlation ID or None if not set
     """
-    # Try context variable first (for async contexts)
-    correlation_id = _correlation_id.get()
-    if correlation_id:
-        return correlation_id
-
-    # Fall back to Flask's g object (for request contexts)
-    return getattr(g, "correlation_id", None)
+    return _correlation_id.get()
 
 
 def _extract_correlation_id(req: Request) -> str:
@@ -109,6 +110,8 @@ class CorrelationMiddleware:
         def before_request() -> None:
             """Extract or generate correlation ID before processing request."""
             correlation_id = _extract_correlation_id(request)
+            # Mirrored onto g for templates/handlers that reach for it
+            # directly; get_correlation_id reads only the ContextVar
             g.correlation_id = correlation_id
             _correlation_id.set(correlation_id)
 
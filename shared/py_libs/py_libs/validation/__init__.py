@@ -25,6 +25,7 @@ from py_libs.validation.base import (
     ValidationResult,
     Validator,
     chain,
+    chain_cached,
 )
 from py_libs.validation.string import (
     IsAlphanumeric,
@@ -42,6 +43,8 @@ from py_libs.validation.numeric import (
     IsIntInRange,
     IsNegative,
     IsPositive,
+    is_float,
+    is_int,
 )
 from py_libs.validation.network import (
     IsEmail,
@@ -66,6 +69,7 @@ __all__ = [
     "ValidationResult",
     "Validator",
     "chain",
+    "chain_cached",
     # String
     "IsNotEmpty",
     "IsLength",
@@ -81,6 +85,8 @@ __all__ = [
     "IsFloatInRange",
     "IsPositive",
     "IsNegative",
+    "is_int",
+    "is_float",
     # Network
     "IsEmail",
     "IsURL",
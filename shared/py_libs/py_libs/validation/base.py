@@ -3,15 +3,15 @@ Base validation classes and utilities.
 
 Provides the foundation for PyDAL-style validators with:
 - Validator abstract base class with __call__ pattern
-- ValidationResult dataclass for structured results
+- ValidationResult class for structured results
 - ValidationError exception for validation failures
 - chain() function for combining multiple validators
 """
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from typing import Any, Callable, Generic, Sequence, TypeVar
 
 T = TypeVar("T")
@@ -32,30 +32,57 @@ class ValidationError(Exception):
         return self.message
 
 
-@dataclass(slots=True, frozen=True)
 class ValidationResult(Generic[T]):
     """
     Result of a validation operation.
 
+    A hand-written __slots__ class rather than a frozen dataclass:
+    results are allocated on every validate() call, and the frozen
+    variant routes each field through object.__setattr__, which is
+    measurable overhead on validation hot paths.
+
     Attributes:
         is_valid: Whether the validation passed
         value: The validated (possibly transformed) value, or None if invalid
         error: Error message if validation failed, or None if valid
     """
 
-    is_valid: bool
-    value: T | None
-    error: str | None
+    __slots__ = ("is_valid", "value", "error")
+
+    def __init__(
+        self,
+        is_valid: bool,
+        value: T | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.is_valid = is_valid
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationResult(is_valid={self.is_valid!r}, "
+            f"value={self.value!r}, error={self.error!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidationResult):
+            return NotImplemented
+        return (
+            self.is_valid == other.is_valid
+            and self.value == other.value
+            and self.error == other.error
+        )
 
     @classmethod
     def success(cls, value: T) -> ValidationResult[T]:
         """Create a successful validation result."""
-        return cls(is_valid=True, value=value, error=None)
+        return cls(True, value, None)
 
     @classmethod
     def failure(cls, error: str) -> ValidationResult[Any]:
         """Create a failed validation result."""
-        return cls(is_valid=False, value=None, error=error)
+        return cls(False, None, error)
 
     def unwrap(self) -> T:
         """
@@ -86,6 +113,41 @@ class ValidationResult(Generic[T]):
         return default
 
 
+def _requires_str(
+    message: str = "Value must be a string",
+) -> Callable[[Callable[[Any, str], ValidationResult[T]]], Callable[[Any, Any], ValidationResult[T]]]:
+    """
+    Decorator guarding a validate() method against non-string input.
+
+    Centralizes the ``isinstance(value, str)`` preamble that every
+    string validator repeated. The exact ``type(value) is str`` check
+    is a single type-slot compare that CPython's inline caches
+    speculate on well; str subclasses take the isinstance fallback so
+    behavior is unchanged.
+
+    Args:
+        message: Failure message for non-string input
+    """
+
+    def decorator(
+        fn: Callable[[Any, str], ValidationResult[T]],
+    ) -> Callable[[Any, Any], ValidationResult[T]]:
+        # One failure instance per decorated method: results are never
+        # mutated after construction, so every non-string rejection can
+        # return this same object instead of allocating a fresh one
+        not_a_string = ValidationResult.failure(message)
+
+        @functools.wraps(fn)
+        def wrapper(self: Any, value: Any) -> ValidationResult[T]:
+            if type(value) is str or isinstance(value, str):
+                return fn(self, value)
+            return not_a_string
+
+        return wrapper
+
+    return decorator
+
+
 class Validator(ABC, Generic[T, V]):
     """
     Abstract base class for validators.
@@ -108,6 +170,8 @@ class Validator(ABC, Generic[T, V]):
         result = validator("HELLO")  # ValidationResult(is_valid=True, value="HELLO")
     """
 
+    __slots__ = ()
+
     def __call__(self, value: T) -> ValidationResult[V]:
         """
         Validate the input value.
@@ -154,24 +218,42 @@ class ChainedValidator(Validator[T, V]):
     the chain stops and returns the failure result.
     """
 
+    __slots__ = ("_validators",)
+
     def __init__(self, validators: Sequence[Validator[Any, Any]]) -> None:
-        self._validators = list(validators)
+        # Tuple: immutable, and CPython iterates it faster than a list
+        self._validators = tuple(validators)
 
     def validate(self, value: T) -> ValidationResult[V]:
         """Run all validators in sequence."""
+        validators = self._validators
+
+        # Unrolled dispatch for the common one- and two-validator
+        # chains: no loop setup, and the last validator's result is
+        # returned as-is instead of being re-wrapped
+        if len(validators) == 1:
+            return validators[0](value)
+        if len(validators) == 2:
+            result = validators[0](value)
+            if not result.is_valid:
+                return result
+            return validators[1](result.value)
+
         current_value: Any = value
 
-        for validator in self._validators:
+        for validator in validators:
             result = validator(current_value)
             if not result.is_valid:
-                return ValidationResult.failure(result.error or "Validation failed")
+                # Return the failure as-is; re-wrapping would allocate
+                # an identical result object
+                return result
             current_value = result.value
 
         return ValidationResult.success(current_value)
 
     def and_then(self, other: Validator[V, Any]) -> ChainedValidator[T, Any]:
         """Add another validator to the chain."""
-        return ChainedValidator([*self._validators, other])
+        return ChainedValidator((*self._validators, other))
 
 
 def chain(*validators: Validator[Any, Any]) -> ChainedValidator[Any, Any]:
@@ -194,5 +276,23 @@ def chain(*validators: Validator[Any, Any]) -> ChainedValidator[Any, Any]:
     return ChainedValidator(validators)
 
 
+@functools.lru_cache(maxsize=256)
+def chain_cached(*validators: Validator[Any, Any]) -> ChainedValidator[Any, Any]:
+    """
+    Memoized variant of chain() for hot paths.
+
+    Repeated calls with the same validator instances (e.g. module-level
+    validators referenced inside a request handler) return the same
+    ChainedValidator instead of rebuilding it per request. Caching is
+    by instance identity, so validators should themselves be hoisted to
+    module scope; better still, hoist the whole chain() call and skip
+    the lookup entirely.
+
+    Example:
+        _EMAIL = chain_cached(IsNotEmpty(), IsEmail())  # built once
+    """
+    return ChainedValidator(validators)
+
+
 # Type alias for validator functions
 ValidatorFunc = Callable[[Any], ValidationResult[Any]]
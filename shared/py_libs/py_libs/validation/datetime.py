@@ -43,6 +43,10 @@ class IsDate(Validator[DateInput, date]):
     ) -> None:
         self.format = format
         self.error_message = error_message
+        # The default ISO format can be parsed by the C-implemented
+        # date.fromisoformat, roughly an order of magnitude faster
+        # than strptime's per-call format handling
+        self._iso_fast = format == "%Y-%m-%d"
 
     def validate(self, value: DateInput) -> ValidationResult[date]:
         if isinstance(value, datetime):
@@ -56,6 +60,20 @@ class IsDate(Validator[DateInput, date]):
             if not value:
                 return ValidationResult.failure(self._get_error_message())
 
+            # Shape guard keeps fromisoformat to exactly the strings
+            # strptime's %Y-%m-%d accepts in padded form; anything
+            # else (including non-padded months) falls through
+            if (
+                self._iso_fast
+                and len(value) == 10
+                and value[4] == "-"
+                and value[7] == "-"
+            ):
+                try:
+                    return ValidationResult.success(date.fromisoformat(value))
+                except ValueError:
+                    return ValidationResult.failure(self._get_error_message())
+
             try:
                 parsed = datetime.strptime(value, self.format)
                 return ValidationResult.success(parsed.date())
@@ -92,6 +110,8 @@ class IsDateTime(Validator[DateTimeInput, datetime]):
     ) -> None:
         self.format = format
         self.error_message = error_message
+        # See IsDate: default ISO format routes to the C parser
+        self._iso_fast = format == "%Y-%m-%dT%H:%M:%S"
 
     def validate(self, value: DateTimeInput) -> ValidationResult[datetime]:
         if isinstance(value, datetime):
@@ -102,6 +122,21 @@ class IsDateTime(Validator[DateTimeInput, datetime]):
             if not value:
                 return ValidationResult.failure(self._get_error_message())
 
+            # Shape guard restricts fromisoformat to the padded
+            # YYYY-MM-DDTHH:MM:SS form strptime would accept
+            if (
+                self._iso_fast
+                and len(value) == 19
+                and value[4] == "-"
+                and value[10] == "T"
+                and value[13] == ":"
+                and value[16] == ":"
+            ):
+                try:
+                    return ValidationResult.success(datetime.fromisoformat(value))
+                except ValueError:
+                    return ValidationResult.failure(self._get_error_message())
+
             try:
                 parsed = datetime.strptime(value, self.format)
                 return ValidationResult.success(parsed)
@@ -136,6 +171,8 @@ class IsTime(Validator[TimeInput, time]):
     ) -> None:
         self.format = format
         self.error_message = error_message
+        # See IsDate: default ISO format routes to the C parser
+        self._iso_fast = format == "%H:%M:%S"
 
     def validate(self, value: TimeInput) -> ValidationResult[time]:
         if isinstance(value, datetime):
@@ -149,6 +186,18 @@ class IsTime(Validator[TimeInput, time]):
             if not value:
                 return ValidationResult.failure(self._get_error_message())
 
+            # Shape guard restricts fromisoformat to padded HH:MM:SS
+            if (
+                self._iso_fast
+                and len(value) == 8
+                and value[2] == ":"
+                and value[5] == ":"
+            ):
+                try:
+                    return ValidationResult.success(time.fromisoformat(value))
+                except ValueError:
+                    return ValidationResult.failure(self._get_error_message())
+
             try:
                 parsed = datetime.strptime(value, self.format)
                 return ValidationResult.success(parsed.time())
@@ -192,11 +241,15 @@ class IsDateInRange(Validator[DateInput, date]):
         self.max_date = max_date
         self.format = format
         self.error_message = error_message
+        # Reuse one parser across calls instead of constructing an
+        # IsDate per validation, and precompute the range messages
+        self._date_validator = IsDate(format=format)
+        self._min_msg = error_message or f"Date must be on or after {min_date}"
+        self._max_msg = error_message or f"Date must be on or before {max_date}"
 
     def validate(self, value: DateInput) -> ValidationResult[date]:
         # First parse the date
-        date_validator = IsDate(format=self.format)
-        result = date_validator.validate(value)
+        result = self._date_validator.validate(value)
         if not result.is_valid:
             return ValidationResult.failure(result.error or "Invalid date")
 
@@ -205,11 +258,9 @@ class IsDateInRange(Validator[DateInput, date]):
 
         # Check range
         if self.min_date is not None and date_value < self.min_date:
-            msg = self.error_message or f"Date must be on or after {self.min_date}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._min_msg)
 
         if self.max_date is not None and date_value > self.max_date:
-            msg = self.error_message or f"Date must be on or before {self.max_date}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._max_msg)
 
         return ValidationResult.success(date_value)
@@ -10,11 +10,17 @@ Provides:
 
 from __future__ import annotations
 
+import functools
 import ipaddress
 import re
-from urllib.parse import urlparse
+import string
 
-from py_libs.validation.base import ValidationResult, Validator
+from py_libs.validation.base import ValidationResult, Validator, _requires_str
+
+# Shared default for IsURL: frozen, so every validator built without an
+# explicit scheme list can point at this one set instead of allocating
+# its own
+_DEFAULT_SCHEMES = frozenset(("http", "https"))
 
 
 class IsEmail(Validator[str, str]):
@@ -33,11 +39,23 @@ class IsEmail(Validator[str, str]):
         result = validator("invalid-email")     # Invalid
     """
 
-    # RFC 5322 compliant email regex (simplified but robust)
+    # RFC 5322 compliant email regex (simplified but robust). The
+    # lookahead enforces total length (<=254) and the bounded local
+    # part (<=64) replaces the old split/len checks, so the whole
+    # validation is one pass in the C regex engine; re.ASCII skips
+    # Unicode property lookups the pattern can't match anyway.
+    # Domain labels sit in atomic groups (?>...) so the engine cannot
+    # backtrack into already-matched labels on crafted inputs --
+    # the nested quantifiers were otherwise superlinear on long
+    # near-miss strings (ReDoS).
+    # Used with fullmatch, so explicit ^/$ anchors are unnecessary (the
+    # lookahead keeps its internal $ to bound total length)
     _EMAIL_PATTERN = re.compile(
-        r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+"
-        r"@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-        r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+$"
+        r"(?=.{3,254}$)"
+        r"[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]{1,64}"
+        r"@(?>[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)"
+        r"(?>\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+",
+        re.ASCII,
     )
 
     def __init__(
@@ -45,25 +63,25 @@ class IsEmail(Validator[str, str]):
     ) -> None:
         self.normalize = normalize
         self.error_message = error_message or "Invalid email address"
-
+        # Bounded per-instance memoization: validators are typically
+        # long-lived and called repeatedly with the same few values
+        # (form redraws, batch validation), and ValidationResult is
+        # immutable so cached results are safe to share. lru_cache is
+        # already thread-safe.
+        self._cached_validate = functools.lru_cache(maxsize=256)(self._validate_impl)
+
+    @_requires_str()
     def validate(self, value: str) -> ValidationResult[str]:
-        if not isinstance(value, str):
-            return ValidationResult.failure("Value must be a string")
+        return self._cached_validate(value)
 
+    def _validate_impl(self, value: str) -> ValidationResult[str]:
         email = value.strip()
         if not email:
             return ValidationResult.failure(self.error_message)
 
-        # Check length constraints
-        if len(email) > 254:
-            return ValidationResult.failure(self.error_message)
-
-        # Check local part length
-        local_part = email.split("@")[0] if "@" in email else email
-        if len(local_part) > 64:
-            return ValidationResult.failure(self.error_message)
-
-        if not self._EMAIL_PATTERN.match(email):
+        # Length limits (total and local part) are enforced by the
+        # pattern itself
+        if not self._EMAIL_PATTERN.fullmatch(email):
             return ValidationResult.failure(self.error_message)
 
         if self.normalize:
@@ -89,6 +107,18 @@ class IsURL(Validator[str, str]):
         result = validator("ftp://files.example.com")  # Valid
     """
 
+    # One C-level match replaces urlparse plus the netloc splits: the
+    # scheme and host are captured directly, the optional userinfo and
+    # port are consumed in passing. The scheme stays a generic token so
+    # disallowed schemes still get the specific error message below.
+    _URL_RE = re.compile(
+        r"([a-zA-Z][a-zA-Z0-9+.-]*)://"  # scheme
+        r"(?:[^/?#@\s]*@)?"  # optional userinfo
+        r"(\[[^]/?#\s]*\]|[^/?#:@\s]+)"  # host (bracketed IPv6 or reg-name)
+        r"(?::\d*)?"  # optional port
+        r"(?:[/?#]|$)"  # path/query/fragment or end of string
+    )
+
     def __init__(
         self,
         require_tld: bool = True,
@@ -96,41 +126,38 @@ class IsURL(Validator[str, str]):
         error_message: str | None = None,
     ) -> None:
         self.require_tld = require_tld
-        self.allowed_schemes = set(allowed_schemes or ["http", "https"])
+        # Prenormalize to lowercase once so the per-call membership
+        # test compares against an already-lowered set
+        if allowed_schemes is None:
+            self.allowed_schemes = _DEFAULT_SCHEMES
+        else:
+            self.allowed_schemes = frozenset(s.lower() for s in allowed_schemes)
         self.error_message = error_message or "Invalid URL"
+        # See IsEmail: repeats become a dict lookup, skipping urlparse
+        self._cached_validate = functools.lru_cache(maxsize=256)(self._validate_impl)
 
+    @_requires_str()
     def validate(self, value: str) -> ValidationResult[str]:
-        if not isinstance(value, str):
-            return ValidationResult.failure("Value must be a string")
+        return self._cached_validate(value)
 
+    def _validate_impl(self, value: str) -> ValidationResult[str]:
         url = value.strip()
         if not url:
             return ValidationResult.failure(self.error_message)
 
-        try:
-            parsed = urlparse(url)
-        except Exception:
-            return ValidationResult.failure(self.error_message)
-
-        # Check scheme
-        if not parsed.scheme:
+        match = self._URL_RE.match(url)
+        if not match:
             return ValidationResult.failure(self.error_message)
 
-        if parsed.scheme.lower() not in self.allowed_schemes:
+        scheme, hostname = match.groups()
+        if scheme.lower() not in self.allowed_schemes:
             return ValidationResult.failure(
                 f"URL scheme must be one of: {', '.join(self.allowed_schemes)}"
             )
 
-        # Check netloc (hostname)
-        if not parsed.netloc:
-            return ValidationResult.failure(self.error_message)
-
         # Check for TLD if required
-        if self.require_tld:
-            hostname = parsed.netloc.split(":")[0]  # Remove port
-            hostname = hostname.split("@")[-1]  # Remove userinfo
-            if "." not in hostname and hostname.lower() != "localhost":
-                return ValidationResult.failure(self.error_message)
+        if self.require_tld and "." not in hostname and hostname.lower() != "localhost":
+            return ValidationResult.failure(self.error_message)
 
         return ValidationResult.success(url)
 
@@ -162,25 +189,27 @@ class IsIPAddress(Validator[str, str]):
         self.version = version
         self.error_message = error_message
 
+    @_requires_str()
     def validate(self, value: str) -> ValidationResult[str]:
-        if not isinstance(value, str):
-            return ValidationResult.failure("Value must be a string")
-
         ip_str = value.strip()
         if not ip_str:
             return ValidationResult.failure(self._get_error_message())
 
+        # Dispatch straight to the right address class: ip_address()
+        # always attempts IPv4 first and swallows a ValueError before
+        # trying IPv6, and a pinned version made a second pass over
+        # the parsed result anyway. A colon can only appear in IPv6
+        # text, so the sniff is exact for the unpinned case.
+        if self.version == 4 or (self.version is None and ":" not in ip_str):
+            address_cls = ipaddress.IPv4Address
+        else:
+            address_cls = ipaddress.IPv6Address
+
         try:
-            ip = ipaddress.ip_address(ip_str)
+            address_cls(ip_str)
         except ValueError:
             return ValidationResult.failure(self._get_error_message())
 
-        # Check version if specified
-        if self.version == 4 and ip.version != 4:
-            return ValidationResult.failure("Value must be a valid IPv4 address")
-        if self.version == 6 and ip.version != 6:
-            return ValidationResult.failure("Value must be a valid IPv6 address")
-
         return ValidationResult.success(ip_str)
 
     def _get_error_message(self) -> str:
@@ -210,11 +239,11 @@ class IsHostname(Validator[str, str]):
         result = validator("invalid..com")  # Invalid
     """
 
-    # RFC 1123 hostname pattern
-    _HOSTNAME_PATTERN = re.compile(r"^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)$")  # Single label
-    _FULL_HOSTNAME_PATTERN = re.compile(
-        r"^(?!-)[a-zA-Z0-9-]{1,63}(?<!-)(?:\.(?!-)[a-zA-Z0-9-]{1,63}(?<!-))*$"
-    )
+    # RFC 1123 label alphabet (hostnames are lowercased before the
+    # check). Splitting on dots and checking labels against this set
+    # runs at C speed with guaranteed linear complexity, replacing a
+    # lookaround-per-label regex.
+    _LABEL_CHARSET = frozenset(string.ascii_lowercase + string.digits + "-")
 
     def __init__(
         self,
@@ -225,11 +254,14 @@ class IsHostname(Validator[str, str]):
         self.allow_ip = allow_ip
         self.require_tld = require_tld
         self.error_message = error_message or "Invalid hostname"
+        # See IsEmail: bounded memoization for repeated inputs
+        self._cached_validate = functools.lru_cache(maxsize=256)(self._validate_impl)
 
+    @_requires_str()
     def validate(self, value: str) -> ValidationResult[str]:
-        if not isinstance(value, str):
-            return ValidationResult.failure("Value must be a string")
+        return self._cached_validate(value)
 
+    def _validate_impl(self, value: str) -> ValidationResult[str]:
         hostname = value.strip().lower()
         if not hostname:
             return ValidationResult.failure(self.error_message)
@@ -246,9 +278,20 @@ class IsHostname(Validator[str, str]):
             except ValueError:
                 pass  # Not an IP, continue with hostname validation
 
-        # Validate hostname format
-        if not self._FULL_HOSTNAME_PATTERN.match(hostname):
-            return ValidationResult.failure(self.error_message)
+        # Validate hostname format: each dot-separated label must be
+        # 1-63 chars from the RFC 1123 alphabet and may not start or
+        # end with a hyphen (empty labels catch leading/trailing and
+        # doubled dots)
+        charset = self._LABEL_CHARSET
+        for label in hostname.split("."):
+            if (
+                not label
+                or len(label) > 63
+                or label[0] == "-"
+                or label[-1] == "-"
+                or not charset.issuperset(label)
+            ):
+                return ValidationResult.failure(self.error_message)
 
         # Check TLD requirement
         if self.require_tld and "." not in hostname:
@@ -8,11 +8,12 @@ Provides:
 - IsFloatInRange: Validates float within range
 - IsPositive: Validates positive numbers
 - IsNegative: Validates negative numbers
+- is_int/is_float: Free-function forms for hot paths
 """
 
 from __future__ import annotations
 
-from typing import Union
+from typing import Sequence, Union
 
 from py_libs.validation.base import ValidationResult, Validator
 
@@ -20,6 +21,79 @@ from py_libs.validation.base import ValidationResult, Validator
 NumericInput = Union[int, float, str]
 
 
+def is_int(
+    value: NumericInput, error_message: str = "Value must be an integer"
+) -> ValidationResult[int]:
+    """
+    Validate that a value is or can be converted to an integer.
+
+    Free-function form of IsInt: hot-path callers that don't need a
+    configured validator instance skip the __call__ -> validate double
+    dispatch by calling this directly.
+
+    Example:
+        result = is_int(42)      # Valid, returns 42
+        result = is_int("42")    # Valid, returns 42
+        result = is_int(3.14)    # Invalid (float)
+    """
+    if type(value) is bool:  # bool is subclass of int
+        return ValidationResult.failure(error_message)
+
+    if isinstance(value, int):
+        return ValidationResult.success(value)
+
+    if isinstance(value, float):
+        if value.is_integer():
+            return ValidationResult.success(int(value))
+        return ValidationResult.failure(error_message)
+
+    if isinstance(value, str):
+        # Fast path: isdecimal() guarantees int() parses without
+        # raising, so plain digit strings (the common bulk-validation
+        # case) skip the substring scans and try/except below
+        if value.isdecimal():
+            return ValidationResult.success(int(value))
+        try:
+            # Don't allow floats in string form. Checking "e" and "E"
+            # separately avoids .lower() allocating a new string per
+            # call.
+            if "." in value or "e" in value or "E" in value:
+                return ValidationResult.failure(error_message)
+            return ValidationResult.success(int(value))
+        except ValueError:
+            return ValidationResult.failure(error_message)
+
+    return ValidationResult.failure(error_message)
+
+
+def is_float(
+    value: NumericInput, error_message: str = "Value must be a number"
+) -> ValidationResult[float]:
+    """
+    Validate that a value is or can be converted to a float.
+
+    Free-function form of IsFloat; see is_int for rationale.
+
+    Example:
+        result = is_float(3.14)    # Valid
+        result = is_float("3.14")  # Valid
+        result = is_float("abc")   # Invalid
+    """
+    if type(value) is bool:
+        return ValidationResult.failure(error_message)
+
+    if isinstance(value, (int, float)):
+        return ValidationResult.success(float(value))
+
+    if isinstance(value, str):
+        try:
+            return ValidationResult.success(float(value))
+        except ValueError:
+            return ValidationResult.failure(error_message)
+
+    return ValidationResult.failure(error_message)
+
+
 class IsInt(Validator[NumericInput, int]):
     """
     Validates that a value is or can be converted to an integer.
@@ -32,31 +106,13 @@ class IsInt(Validator[NumericInput, int]):
         result = validator("abc")   # Invalid
     """
 
+    __slots__ = ("error_message",)
+
     def __init__(self, error_message: str | None = None) -> None:
         self.error_message = error_message or "Value must be an integer"
 
     def validate(self, value: NumericInput) -> ValidationResult[int]:
-        if isinstance(value, bool):  # bool is subclass of int
-            return ValidationResult.failure(self.error_message)
-
-        if isinstance(value, int):
-            return ValidationResult.success(value)
-
-        if isinstance(value, float):
-            if value.is_integer():
-                return ValidationResult.success(int(value))
-            return ValidationResult.failure(self.error_message)
-
-        if isinstance(value, str):
-            try:
-                # Don't allow floats in string form
-                if "." in value or "e" in value.lower():
-                    return ValidationResult.failure(self.error_message)
-                return ValidationResult.success(int(value))
-            except ValueError:
-                return ValidationResult.failure(self.error_message)
-
-        return ValidationResult.failure(self.error_message)
+        return is_int(value, self.error_message)
 
 
 class IsFloat(Validator[NumericInput, float]):
@@ -71,23 +127,55 @@ class IsFloat(Validator[NumericInput, float]):
         result = validator("abc")   # Invalid
     """
 
+    __slots__ = ("error_message",)
+
     def __init__(self, error_message: str | None = None) -> None:
         self.error_message = error_message or "Value must be a number"
 
     def validate(self, value: NumericInput) -> ValidationResult[float]:
-        if isinstance(value, bool):
-            return ValidationResult.failure(self.error_message)
+        return is_float(value, self.error_message)
 
-        if isinstance(value, (int, float)):
-            return ValidationResult.success(float(value))
 
-        if isinstance(value, str):
-            try:
-                return ValidationResult.success(float(value))
-            except ValueError:
-                return ValidationResult.failure(self.error_message)
+def _coerce_int(value: NumericInput) -> int | None:
+    """
+    Coerce a value to int using IsInt's rules, or None if invalid.
 
-        return ValidationResult.failure(self.error_message)
+    Lets the range/sign validators check types without building an
+    intermediate ValidationResult that is immediately discarded — the
+    success path then constructs exactly one result object.
+    """
+    if type(value) is bool:  # bool is subclass of int
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        # isdecimal() guarantees int() parses without raising
+        if value.isdecimal():
+            return int(value)
+        # Don't allow floats in string form; avoid .lower() allocation
+        if "." in value or "e" in value or "E" in value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _coerce_float(value: NumericInput) -> float | None:
+    """Coerce a value to float using IsFloat's rules, or None if invalid."""
+    if type(value) is bool:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
 
 
 class IsIntInRange(Validator[NumericInput, int]):
@@ -105,6 +193,8 @@ class IsIntInRange(Validator[NumericInput, int]):
         result = validator(101)  # Invalid
     """
 
+    __slots__ = ("min_value", "max_value", "error_message", "_min_msg", "_max_msg")
+
     def __init__(
         self,
         min_value: int | None = None,
@@ -114,28 +204,54 @@ class IsIntInRange(Validator[NumericInput, int]):
         self.min_value = min_value
         self.max_value = max_value
         self.error_message = error_message
+        # Precompute failure messages so the failure path doesn't pay
+        # f-string formatting per call
+        self._min_msg = error_message or f"Value must be at least {min_value}"
+        self._max_msg = error_message or f"Value must be at most {max_value}"
 
     def validate(self, value: NumericInput) -> ValidationResult[int]:
         # First validate it's an integer
-        int_result = IsInt().validate(value)
-        if not int_result.is_valid:
-            return ValidationResult.failure(
-                int_result.error or "Value must be an integer"
-            )
-
-        int_value = int_result.value
-        assert int_value is not None  # Type narrowing
+        int_value = _coerce_int(value)
+        if int_value is None:
+            return ValidationResult.failure("Value must be an integer")
 
         if self.min_value is not None and int_value < self.min_value:
-            msg = self.error_message or f"Value must be at least {self.min_value}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._min_msg)
 
         if self.max_value is not None and int_value > self.max_value:
-            msg = self.error_message or f"Value must be at most {self.max_value}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._max_msg)
 
         return ValidationResult.success(int_value)
 
+    def validate_many(
+        self, values: Sequence[NumericInput]
+    ) -> list[tuple[int, str]]:
+        """
+        Validate a batch of values in one pass.
+
+        Only failures are materialized, so validating a mostly-valid
+        column (CSV ingestion, bulk config parsing) allocates nothing
+        per valid element instead of one ValidationResult each.
+
+        Args:
+            values: Sequence of values to validate
+
+        Returns:
+            List of (index, error) pairs; empty if all values pass
+        """
+        failures: list[tuple[int, str]] = []
+        min_value = self.min_value
+        max_value = self.max_value
+        for index, value in enumerate(values):
+            int_value = _coerce_int(value)
+            if int_value is None:
+                failures.append((index, "Value must be an integer"))
+            elif min_value is not None and int_value < min_value:
+                failures.append((index, self._min_msg))
+            elif max_value is not None and int_value > max_value:
+                failures.append((index, self._max_msg))
+        return failures
+
 
 class IsFloatInRange(Validator[NumericInput, float]):
     """
@@ -152,6 +268,8 @@ class IsFloatInRange(Validator[NumericInput, float]):
         result = validator(1.1)   # Invalid
     """
 
+    __slots__ = ("min_value", "max_value", "error_message", "_min_msg", "_max_msg")
+
     def __init__(
         self,
         min_value: float | None = None,
@@ -161,28 +279,50 @@ class IsFloatInRange(Validator[NumericInput, float]):
         self.min_value = min_value
         self.max_value = max_value
         self.error_message = error_message
+        self._min_msg = error_message or f"Value must be at least {min_value}"
+        self._max_msg = error_message or f"Value must be at most {max_value}"
 
     def validate(self, value: NumericInput) -> ValidationResult[float]:
         # First validate it's a number
-        float_result = IsFloat().validate(value)
-        if not float_result.is_valid:
-            return ValidationResult.failure(
-                float_result.error or "Value must be a number"
-            )
-
-        float_value = float_result.value
-        assert float_value is not None  # Type narrowing
+        float_value = _coerce_float(value)
+        if float_value is None:
+            return ValidationResult.failure("Value must be a number")
 
         if self.min_value is not None and float_value < self.min_value:
-            msg = self.error_message or f"Value must be at least {self.min_value}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._min_msg)
 
         if self.max_value is not None and float_value > self.max_value:
-            msg = self.error_message or f"Value must be at most {self.max_value}"
-            return ValidationResult.failure(msg)
+            return ValidationResult.failure(self._max_msg)
 
         return ValidationResult.success(float_value)
 
+    def validate_many(
+        self, values: Sequence[NumericInput]
+    ) -> list[tuple[int, str]]:
+        """
+        Validate a batch of values in one pass.
+
+        See IsIntInRange.validate_many; same contract for floats.
+
+        Args:
+            values: Sequence of values to validate
+
+        Returns:
+            List of (index, error) pairs; empty if all values pass
+        """
+        failures: list[tuple[int, str]] = []
+        min_value = self.min_value
+        max_value = self.max_value
+        for index, value in enumerate(values):
+            float_value = _coerce_float(value)
+            if float_value is None:
+                failures.append((index, "Value must be a number"))
+            elif min_value is not None and float_value < min_value:
+                failures.append((index, self._min_msg))
+            elif max_value is not None and float_value > max_value:
+                failures.append((index, self._max_msg))
+        return failures
+
 
 class IsPositive(Validator[NumericInput, float]):
     """
@@ -198,30 +338,24 @@ class IsPositive(Validator[NumericInput, float]):
         result = validator(0)    # Invalid (unless allow_zero=True)
     """
 
+    __slots__ = ("allow_zero", "error_message", "_msg")
+
     def __init__(
         self, allow_zero: bool = False, error_message: str | None = None
     ) -> None:
         self.allow_zero = allow_zero
         self.error_message = error_message
+        self._msg = error_message or (
+            "Value must be zero or positive" if allow_zero else "Value must be positive"
+        )
 
     def validate(self, value: NumericInput) -> ValidationResult[float]:
-        float_result = IsFloat().validate(value)
-        if not float_result.is_valid:
-            return ValidationResult.failure(
-                float_result.error or "Value must be a number"
-            )
-
-        float_value = float_result.value
-        assert float_value is not None
-
-        if self.allow_zero:
-            if float_value < 0:
-                msg = self.error_message or "Value must be zero or positive"
-                return ValidationResult.failure(msg)
-        else:
-            if float_value <= 0:
-                msg = self.error_message or "Value must be positive"
-                return ValidationResult.failure(msg)
+        float_value = _coerce_float(value)
+        if float_value is None:
+            return ValidationResult.failure("Value must be a number")
+
+        if float_value < 0 or (not self.allow_zero and float_value == 0):
+            return ValidationResult.failure(self._msg)
 
         return ValidationResult.success(float_value)
 
@@ -240,29 +374,23 @@ class IsNegative(Validator[NumericInput, float]):
         result = validator(0)    # Invalid (unless allow_zero=True)
     """
 
+    __slots__ = ("allow_zero", "error_message", "_msg")
+
     def __init__(
         self, allow_zero: bool = False, error_message: str | None = None
     ) -> None:
         self.allow_zero = allow_zero
         self.error_message = error_message
+        self._msg = error_message or (
+            "Value must be zero or negative" if allow_zero else "Value must be negative"
+        )
 
     def validate(self, value: NumericInput) -> ValidationResult[float]:
-        float_result = IsFloat().validate(value)
-        if not float_result.is_valid:
-            return ValidationResult.failure(
-                float_result.error or "Value must be a number"
-            )
-
-        float_value = float_result.value
-        assert float_value is not None
-
-        if self.allow_zero:
-            if float_value > 0:
-                msg = self.error_message or "Value must be zero or negative"
-                return ValidationResult.failure(msg)
-        else:
-            if float_value >= 0:
-                msg = self.error_message or "Value must be negative"
-                return ValidationResult.failure(msg)
+        float_value = _coerce_float(value)
+        if float_value is None:
+            return ValidationResult.failure("Value must be a number")
+
+        if float_value > 0 or (not self.allow_zero and float_value == 0):
+            return ValidationResult.failure(self._msg)
 
         return ValidationResult.success(float_value)
@@ -10,9 +10,9 @@ from __future__ import annotations
 
 import re
 import string
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 
-from py_libs.validation.base import ValidationResult, Validator
+from py_libs.validation.base import ValidationResult, Validator, _requires_str
 
 
 @dataclass(slots=True, frozen=True)
@@ -86,6 +86,12 @@ class PasswordOptions:
         )
 
 
+# Shared default options: PasswordOptions is frozen, so validators
+# constructed without overrides can all point at this one instance
+_DEFAULT_OPTIONS = PasswordOptions()
+_OPTION_FIELDS = frozenset(f.name for f in fields(PasswordOptions))
+
+
 class IsStrongPassword(Validator[str, str]):
     """
     Validates password strength based on configurable requirements.
@@ -106,6 +112,24 @@ class IsStrongPassword(Validator[str, str]):
         validator = IsStrongPassword(min_length=12, require_special=True)
     """
 
+    _LOWER = frozenset(string.ascii_lowercase)
+    _UPPER = frozenset(string.ascii_uppercase)
+    _DIGIT = frozenset(string.digits)
+    # Common weak patterns combined into one compiled alternation;
+    # ^ binds to the first branch only, keeping "123" leading-anchored
+    # as before
+    _COMMON_PATTERN = re.compile(r"^123|abc|qwerty|password|(.)\1{2,}")
+    # Bytes twin of the pattern above: for ASCII passwords (the vast
+    # majority) scanning a bytes view skips sre's Unicode table
+    # indirection
+    _COMMON_PATTERN_B = re.compile(rb"^123|abc|qwerty|password|(.)\1{2,}")
+
+    # Bit positions for the requirement/found masks used in validate
+    _UPPER_BIT = 1
+    _LOWER_BIT = 2
+    _DIGIT_BIT = 4
+    _SPECIAL_BIT = 8
+
     def __init__(
         self,
         options: PasswordOptions | None = None,
@@ -114,73 +138,107 @@ class IsStrongPassword(Validator[str, str]):
     ) -> None:
         if options is not None:
             self.options = options
+        elif not kwargs:
+            # No overrides: share the frozen default instead of
+            # building two dataclasses and an 8-entry dict per
+            # validator
+            self.options = _DEFAULT_OPTIONS
         else:
-            # Apply kwargs overrides to defaults
-            default_opts = PasswordOptions()
-            opt_dict = {
-                "min_length": kwargs.get("min_length", default_opts.min_length),
-                "max_length": kwargs.get("max_length", default_opts.max_length),
-                "require_uppercase": kwargs.get(
-                    "require_uppercase", default_opts.require_uppercase
-                ),
-                "require_lowercase": kwargs.get(
-                    "require_lowercase", default_opts.require_lowercase
-                ),
-                "require_digit": kwargs.get(
-                    "require_digit", default_opts.require_digit
-                ),
-                "require_special": kwargs.get(
-                    "require_special", default_opts.require_special
-                ),
-                "special_chars": kwargs.get(
-                    "special_chars", default_opts.special_chars
-                ),
-                "disallow_spaces": kwargs.get(
-                    "disallow_spaces", default_opts.disallow_spaces
-                ),
-            }
-            self.options = PasswordOptions(**opt_dict)  # type: ignore[arg-type]
+            # Apply kwargs overrides to defaults; unknown keys are
+            # ignored, as before
+            overrides = {k: v for k, v in kwargs.items() if k in _OPTION_FIELDS}
+            self.options = replace(_DEFAULT_OPTIONS, **overrides)  # type: ignore[arg-type]
 
         self.error_message = error_message
+        # Built once; the per-call set(special_chars) was a fresh
+        # allocation on every validation
+        self._special_set = frozenset(self.options.special_chars)
+        # Pack the four require_* flags into one bitmask so the scan
+        # loop compares a single int instead of reading four dataclass
+        # attributes per password
+        opts = self.options
+        self._req_mask = (
+            (self._UPPER_BIT if opts.require_uppercase else 0)
+            | (self._LOWER_BIT if opts.require_lowercase else 0)
+            | (self._DIGIT_BIT if opts.require_digit else 0)
+            | (self._SPECIAL_BIT if opts.require_special else 0)
+        )
 
+    @_requires_str("Password must be a string")
     def validate(self, value: str) -> ValidationResult[str]:
-        if not isinstance(value, str):
-            return ValidationResult.failure("Password must be a string")
-
-        errors: list[str] = []
         opts = self.options
+        # With a caller-supplied error_message every per-rule string
+        # would be formatted only to be thrown away, so that path
+        # fails fast on the first violation without building any
+        custom_msg = self.error_message
 
         # Length checks
-        if len(value) < opts.min_length:
+        length = len(value)
+        too_short = length < opts.min_length
+        too_long = length > opts.max_length
+        if custom_msg is not None and (too_short or too_long):
+            return ValidationResult.failure(custom_msg)
+
+        # Single pass over the password instead of one scan per
+        # character class; found character classes accumulate in a
+        # bitmask so "all requirements met?" is one int comparison,
+        # and the loop bails out as soon as it is answered
+        check_space = opts.disallow_spaces
+        req_mask = self._req_mask
+        special_set = self._special_set
+        found_mask = 0
+        has_space = False
+
+        for c in value:
+            if c == " ":
+                has_space = True
+            elif not found_mask & self._UPPER_BIT and c.isupper():
+                found_mask |= self._UPPER_BIT
+            elif not found_mask & self._LOWER_BIT and c.islower():
+                found_mask |= self._LOWER_BIT
+            elif not found_mask & self._DIGIT_BIT and c.isdigit():
+                found_mask |= self._DIGIT_BIT
+            elif not found_mask & self._SPECIAL_BIT and c in special_set:
+                found_mask |= self._SPECIAL_BIT
+            else:
+                continue
+
+            if found_mask & req_mask == req_mask and (has_space or not check_space):
+                break
+
+        missing = req_mask & ~found_mask
+        space_violation = check_space and has_space
+
+        if custom_msg is not None:
+            if space_violation or missing:
+                return ValidationResult.failure(custom_msg)
+            return ValidationResult.success(value)
+
+        errors: list[str] = []
+        if too_short:
             errors.append(f"Password must be at least {opts.min_length} characters")
 
-        if len(value) > opts.max_length:
+        if too_long:
             errors.append(f"Password must be at most {opts.max_length} characters")
 
-        # Space check
-        if opts.disallow_spaces and " " in value:
+        if space_violation:
             errors.append("Password cannot contain spaces")
 
-        # Character type checks
-        if opts.require_uppercase and not any(c.isupper() for c in value):
+        if missing & self._UPPER_BIT:
             errors.append("Password must contain at least one uppercase letter")
 
-        if opts.require_lowercase and not any(c.islower() for c in value):
+        if missing & self._LOWER_BIT:
             errors.append("Password must contain at least one lowercase letter")
 
-        if opts.require_digit and not any(c.isdigit() for c in value):
+        if missing & self._DIGIT_BIT:
             errors.append("Password must contain at least one digit")
 
-        if opts.require_special:
-            special_set = set(opts.special_chars)
-            if not any(c in special_set for c in value):
-                errors.append(
-                    f"Password must contain at least one special character ({opts.special_chars[:10]}...)"
-                )
+        if missing & self._SPECIAL_BIT:
+            errors.append(
+                f"Password must contain at least one special character ({opts.special_chars[:10]}...)"
+            )
 
         if errors:
-            if self.error_message:
-                return ValidationResult.failure(self.error_message)
             return ValidationResult.failure("; ".join(errors))
 
         return ValidationResult.success(value)
@@ -203,11 +261,13 @@ class IsStrongPassword(Validator[str, str]):
         # Length contribution (up to 30 points)
         score += min(len(password) * 2, 30)
 
-        # Character variety (up to 40 points)
-        has_lower = any(c in string.ascii_lowercase for c in password)
-        has_upper = any(c in string.ascii_uppercase for c in password)
-        has_digit = any(c in string.digits for c in password)
-        has_special = any(c in self.options.special_chars for c in password)
+        # Character variety (up to 40 points); isdisjoint short-circuits
+        # at C speed on the first hit instead of scanning the class
+        # string per character
+        has_lower = not self._LOWER.isdisjoint(password)
+        has_upper = not self._UPPER.isdisjoint(password)
+        has_digit = not self._DIGIT.isdisjoint(password)
+        has_special = not self._special_set.isdisjoint(password)
 
         variety = sum([has_lower, has_upper, has_digit, has_special])
         score += variety * 10
@@ -217,15 +277,13 @@ class IsStrongPassword(Validator[str, str]):
             unique_ratio = len(set(password)) / len(password)
             score += int(unique_ratio * 20)
 
-        # No common patterns bonus (up to 10 points)
-        common_patterns = [
-            r"^123",
-            r"abc",
-            r"qwerty",
-            r"password",
-            r"(.)\1{2,}",  # Repeated characters
-        ]
-        has_common = any(re.search(p, password.lower()) for p in common_patterns)
+        # No common patterns bonus (up to 10 points); lower once, and
+        # scan as bytes when the password is pure ASCII
+        lowered = password.lower()
+        if lowered.isascii():
+            has_common = self._COMMON_PATTERN_B.search(lowered.encode("ascii"))
+        else:
+            has_common = self._COMMON_PATTERN.search(lowered)
         if not has_common:
             score += 10
 
@@ -3,21 +3,39 @@ WaddlePerf webClient API - Flask backend with WebSocket support
 Proxies test requests to testServer and handles authentication with managerServer
 """
 
+# Monkey-patch before anything else imports socket/ssl/threading:
+# without it Socket.IO falls back to the threading mode and every
+# blocking call (requests.post to the testServer, PyMySQL queries)
+# serializes the worker instead of yielding the greenlet.
+import eventlet
+eventlet.monkey_patch()
+from eventlet import tpool
+
 import os
+import hashlib
+import itertools
+import json
 import logging
 import secrets
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import threading
+import time
+from typing import Annotated, Optional, Dict, Any
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
-from flask import Flask, request, jsonify, session
+from flask import Flask, Response, request, jsonify, session
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, disconnect
 import requests
+from requests.adapters import HTTPAdapter
 import pymysql
 from pymysql.cursors import DictCursor
+from dbutils.pooled_db import PooledDB
 import bcrypt
 import jwt
+import msgspec
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -26,8 +44,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Test results proxied from the testServer can run to multi-KB
+    payloads (counts up to 1000); orjson encodes and decodes them
+    several times faster than the stdlib json module, freeing CPU in
+    the eventlet worker.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', secrets.token_hex(32))
 app.config['SESSION_COOKIE_SECURE'] = os.getenv('SESSION_COOKIE_SECURE', 'false').lower() == 'true'
 app.config['SESSION_COOKIE_HTTPONLY'] = True
@@ -36,11 +71,36 @@ app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 # Enable CORS for React frontend
 CORS(app, supports_credentials=True, origins=os.getenv('FRONTEND_URL', 'http://localhost:3000').split(','))
 
+class _SocketIOJSON:
+    """orjson-backed codec for Socket.IO packet payloads.
+
+    python-socketio otherwise encodes every emitted frame (progress,
+    results, errors) with the stdlib json module; this routes those
+    through the same orjson codec Flask already uses. dumps must accept
+    and ignore the separators kwarg python-socketio passes, and return
+    str since packets are concatenated as text.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # Initialize SocketIO with CORS support
+# SOCKETIO_MESSAGE_QUEUE (e.g. redis://redis:6379/0) attaches a Redis-backed
+# manager so events reach clients regardless of which replica emits them,
+# allowing the webClient API to scale horizontally.
 socketio = SocketIO(
     app,
+    async_mode='eventlet',
+    json=_SocketIOJSON,
     cors_allowed_origins=os.getenv('FRONTEND_URL', 'http://localhost:3000').split(','),
-    cors_credentials=True
+    cors_credentials=True,
+    message_queue=os.getenv('SOCKETIO_MESSAGE_QUEUE')
 )
 
 # Configuration
@@ -48,6 +108,30 @@ MANAGER_URL = os.getenv('MANAGER_URL', 'http://localhost:5001')
 TESTSERVER_URL = os.getenv('TESTSERVER_URL', 'http://localhost:8080')
 AUTH_ENABLED = os.getenv('AUTH_ENABLED', 'true').lower() == 'true'
 
+# bcrypt verification is deliberately slow (tens to hundreds of ms);
+# login runs it via eventlet.tpool.execute, eventlet's real OS-thread
+# pool, so the hub keeps serving other greenlets while a password
+# verifies. A ThreadPoolExecutor is no use here: monkey_patch() turns
+# its workers into greenlets, so the native bcrypt call would stall
+# the whole hub for its duration. Pool size is eventlet's, tunable via
+# EVENTLET_THREADPOOL_SIZE.
+
+# Shared session for testServer calls: keep-alive reuses connections
+# across test requests instead of paying a TCP (and TLS) handshake on
+# every proxy hop
+_ts_session = requests.Session()
+_ts_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100)
+_ts_session.mount('http://', _ts_adapter)
+_ts_session.mount('https://', _ts_adapter)
+
+# Cap in-flight testServer calls per process: a connection burst would
+# otherwise fan out into an unbounded number of simultaneous upstream
+# requests and collapse testServer tail latency. Clients over the cap
+# get an immediate 503 instead of queueing behind a timeout.
+UPSTREAM_MAX_INFLIGHT = int(os.getenv('UPSTREAM_MAX_INFLIGHT', '25'))
+_upstream_sem = eventlet.semaphore.BoundedSemaphore(UPSTREAM_MAX_INFLIGHT)
+_UPSTREAM_BUSY_MSG = 'Too many tests in flight, try again shortly'
+
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'localhost'),
     'port': int(os.getenv('DB_PORT', '3306')),
@@ -59,6 +143,19 @@ DB_CONFIG = {
 }
 
 
+# Default device serial for clients that don't send one. Serials only
+# need to be distinguishable, not unguessable, so a pid-qualified
+# counter avoids the /dev/urandom read secrets.token_hex paid on every
+# test request. Session ids still use secrets.token_hex(32) -- those
+# need real entropy.
+_device_serial_counter = itertools.count()
+
+
+def _default_device_serial() -> str:
+    """Generate a cheap unique default device serial"""
+    return f"webclient-{os.getpid():x}-{next(_device_serial_counter):x}"
+
+
 @dataclass
 class User:
     """User data class"""
@@ -70,122 +167,407 @@ class User:
     ou_id: Optional[int] = None
 
 
+# Optional short-TTL auth cache: session and API-key validation hit
+# MySQL on every request and every WebSocket event, so a cache hit
+# replaces a DB round-trip with a sub-ms lookup. Enabled by pointing
+# SESSION_CACHE_URL at a Redis instance (e.g. redis://redis:6379/1);
+# unset, every lookup goes straight to the database as before. TTLs
+# are short so role changes and key revocations propagate quickly.
+SESSION_CACHE_URL = os.getenv('SESSION_CACHE_URL')
+SESSION_CACHE_TTL = int(os.getenv('SESSION_CACHE_TTL', '300'))
+API_KEY_CACHE_TTL = int(os.getenv('API_KEY_CACHE_TTL', '600'))
+AUTH_STATUS_CACHE_TTL = int(os.getenv('AUTH_STATUS_CACHE_TTL', '30'))
+
+_auth_cache = None
+if SESSION_CACHE_URL:
+    import redis
+    _auth_cache = redis.Redis.from_url(SESSION_CACHE_URL, decode_responses=True)
+
+
+def _api_key_cache_key(api_key: str) -> str:
+    """Cache key for an API key (hashed so raw keys never hit Redis)"""
+    return 'akey:' + hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
+
+def _cache_get_user(key: str) -> Optional[User]:
+    """Fetch a cached User; cache errors degrade to a DB lookup"""
+    if _auth_cache is None:
+        return None
+    try:
+        raw = _auth_cache.get(key)
+        if raw:
+            return User(**json.loads(raw))
+    except Exception as e:
+        logger.warning(f"Auth cache read error: {e}")
+    return None
+
+
+def _cache_put_user(key: str, user: User, ttl: int) -> None:
+    """Store a User in the auth cache; errors are non-fatal"""
+    if _auth_cache is None:
+        return
+    try:
+        _auth_cache.setex(key, ttl, json.dumps(asdict(user)))
+    except Exception as e:
+        logger.warning(f"Auth cache write error: {e}")
+
+
+def _cache_delete(key: str) -> None:
+    """Invalidate an auth cache entry; errors are non-fatal"""
+    if _auth_cache is None:
+        return
+    try:
+        _auth_cache.delete(key)
+    except Exception as e:
+        logger.warning(f"Auth cache delete error: {e}")
+
+
+# Connection pool: every endpoint used to open and tear down a full
+# TCP+auth handshake to MySQL for a single lookup, which dominated
+# latency on the per-request authentication path. Pooled connections
+# are returned by conn.close(), so call sites are unchanged. The pool
+# is built lazily so the app still boots (and /health reports degraded)
+# when the database is unreachable at startup.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+DB_POOL_MIN_IDLE = int(os.getenv('DB_POOL_MIN_IDLE', '5'))
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
+def _get_db_pool():
+    """Get or lazily create the shared PyMySQL connection pool"""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = PooledDB(
+                    creator=pymysql,
+                    mincached=DB_POOL_MIN_IDLE,
+                    maxcached=DB_POOL_SIZE,
+                    maxconnections=DB_POOL_SIZE,
+                    blocking=True,
+                    ping=1,  # verify liveness when a connection is handed out
+                    **DB_CONFIG
+                )
+    return _db_pool
+
+
 def get_db_connection():
-    """Get database connection"""
+    """Get a database connection from the pool"""
     try:
-        conn = pymysql.connect(**DB_CONFIG)
-        return conn
+        return _get_db_pool().connection()
     except Exception as e:
         logger.error(f"Database connection error: {e}")
         raise
 
 
-def validate_session(session_id: str) -> Optional[User]:
-    """Validate session against database"""
-    if not AUTH_ENABLED:
+# Hot-path SQL hoisted to module constants: the statement text is built
+# (and its triple-quoted literal dedented) once at import instead of on
+# every call. True server-side PREPARE isn't worth it through PyMySQL's
+# text protocol -- EXECUTE ... USING needs a separate SET round-trip per
+# parameter, which costs more than the parse it saves.
+# UNION ALL of two unique point reads: each branch seeks its own UNIQUE
+# index (sessions.session_id, users.api_key), so the optimizer never
+# has to satisfy a predicate that spans both tables. A NULL credential
+# makes its branch match nothing.
+_SQL_AUTH_LOOKUP = """
+    (SELECT u.id, u.username, u.email, u.api_key, u.role, u.ou_id,
+            s.session_id AS matched_session, s.expires_at AS session_expires_at
+     FROM sessions s
+     JOIN users u ON u.id = s.user_id
+     WHERE s.session_id = %s)
+    UNION ALL
+    (SELECT id, username, email, api_key, role, ou_id,
+            NULL, NULL
+     FROM users
+     WHERE api_key = %s AND is_active = TRUE)
+"""
+
+_SQL_LOGIN_SELECT = """
+    SELECT id, username, email, password_hash, api_key, role, ou_id
+    FROM users
+    WHERE username = %s AND is_active = TRUE
+"""
+
+_SQL_SESSION_INSERT = """
+    INSERT INTO sessions (session_id, user_id, expires_at)
+    VALUES (%s, %s, %s)
+"""
+
+_SQL_API_KEY_BY_ID = """
+    SELECT api_key
+    FROM users
+    WHERE id = %s AND is_active = TRUE
+"""
+
+_SQL_SESSION_DELETE = "DELETE FROM sessions WHERE session_id = %s"
+
+_SQL_SESSION_SWEEP = "DELETE FROM sessions WHERE expires_at < NOW()"
+
+
+# Expired sessions are pruned by a background greenlet instead of an
+# expires_at > NOW() predicate on every auth query. The volatile NOW()
+# comparison defeated a pure index lookup on the hot path, and without
+# pruning the sessions table grows with every login ever made rather
+# than staying proportional to active users.
+SESSION_SWEEP_INTERVAL = int(os.getenv('SESSION_SWEEP_INTERVAL', '60'))
+
+
+def _session_sweeper() -> None:
+    """Periodically delete expired session rows"""
+    while True:
+        socketio.sleep(SESSION_SWEEP_INTERVAL)
+        conn = None
+        try:
+            conn = get_db_connection()
+            with conn.cursor() as cursor:
+                deleted = cursor.execute(_SQL_SESSION_SWEEP)
+            if deleted:
+                logger.info(f"Session sweeper removed {deleted} expired sessions")
+        except Exception as e:
+            logger.warning(f"Session sweep error: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+
+def validate_auth(session_id: Optional[str], api_key: Optional[str]) -> Optional[User]:
+    """
+    Validate a session id and/or API key in a single query.
+
+    Requests carrying a stale cookie plus a valid API key used to cost
+    two full DB round-trips; one UNION of two unique point reads
+    resolves both credentials at once. An unexpired session wins; a
+    stale or expired session falls through to the API-key row, matching
+    the old two-query behavior. The session path matches any unexpired
+    session (as before), the API-key path additionally requires an
+    active user.
+
+    Expiry is enforced in Python rather than with expires_at > NOW()
+    in SQL: the background sweeper keeps expired rows out of the table,
+    so the hot query stays a pure unique-index seek on session_id.
+    """
+    if not AUTH_ENABLED or not (session_id or api_key):
         return None
 
+    session_cache_key = f"sess:{session_id}" if session_id else None
+    if session_cache_key:
+        user = _cache_get_user(session_cache_key)
+        if user:
+            return user
+
+    api_cache_key = _api_key_cache_key(api_key) if api_key else None
+    if api_cache_key:
+        user = _cache_get_user(api_cache_key)
+        if user:
+            return user
+
+    conn = None
     try:
         conn = get_db_connection()
         with conn.cursor() as cursor:
-            cursor.execute("""
-                SELECT s.user_id, s.data, s.expires_at, u.username, u.email, u.api_key, u.role, u.ou_id
-                FROM sessions s
-                JOIN users u ON s.user_id = u.id
-                WHERE s.session_id = %s AND s.expires_at > NOW()
-            """, (session_id,))
-            result = cursor.fetchone()
+            cursor.execute(_SQL_AUTH_LOOKUP, (session_id, api_key))
+            rows = cursor.fetchall()
+
+            result = None
+            for row in rows:
+                if row['matched_session']:
+                    if (row['session_expires_at'] is not None
+                            and row['session_expires_at'] <= datetime.utcnow()):
+                        # Safety net for rows the sweeper hasn't pruned
+                        # yet; fall through to the API-key row, if any
+                        continue
+                    result = row
+                    break
+                if result is None:
+                    result = row
 
             if result:
-                return User(
-                    id=result['user_id'],
+                user = User(
+                    id=result['id'],
                     username=result['username'],
                     email=result['email'],
                     api_key=result['api_key'],
                     role=result['role'],
                     ou_id=result['ou_id']
                 )
+                if result['matched_session'] and session_cache_key:
+                    _cache_put_user(session_cache_key, user, SESSION_CACHE_TTL)
+                elif api_cache_key:
+                    _cache_put_user(api_cache_key, user, API_KEY_CACHE_TTL)
+                return user
     except Exception as e:
-        logger.error(f"Session validation error: {e}")
+        logger.error(f"Auth validation error: {e}")
     finally:
-        conn.close()
+        if conn:
+            conn.close()
 
     return None
 
 
+def validate_session(session_id: str) -> Optional[User]:
+    """Validate session against cache, then database"""
+    return validate_auth(session_id, None)
+
+
 def validate_api_key(api_key: str) -> Optional[User]:
-    """Validate API key against database"""
-    if not AUTH_ENABLED:
+    """Validate API key against cache, then database"""
+    return validate_auth(None, api_key)
+
+
+# Short-lived signed token issued at login: while it is fresh, request
+# validation is a local HMAC verify instead of a DB (or Redis) round
+# trip. The TTL is short so role changes and revocations propagate
+# within minutes; once the token expires, requests transparently fall
+# back to the DB-backed session cookie. Note that with the default
+# per-process random SECRET_KEY, tokens only verify on the replica
+# that issued them -- set SECRET_KEY for multi-replica deployments
+# (the session fallback keeps auth correct either way).
+JWT_TTL = int(os.getenv('JWT_TTL', '300'))
+_JWT_COOKIE = 'auth_token'
+
+
+def _issue_auth_token(user: User) -> str:
+    """Issue a short-lived HS256 token carrying non-secret claims.
+
+    The permanent api_key deliberately stays out: a JWT is signed, not
+    encrypted, so anyone holding the 5-minute cookie could base64-decode
+    a long-lived credential out of it. Proxy paths that need the key
+    resolve it lazily via _resolve_api_key.
+    """
+    claims = {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'role': user.role,
+        'exp': datetime.utcnow() + timedelta(seconds=JWT_TTL)
+    }
+    return jwt.encode(claims, app.config['SECRET_KEY'], algorithm='HS256')
+
+
+def validate_jwt(token: str) -> Optional[User]:
+    """Validate a signed auth token without touching the database"""
+    try:
+        claims = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+        return User(
+            id=claims['id'],
+            username=claims['username'],
+            email=claims['email'],
+            api_key='',  # not carried in the token; resolved lazily
+            role=claims['role'],
+            ou_id=None
+        )
+    except (jwt.InvalidTokenError, KeyError):
         return None
 
+
+def _resolve_api_key(user: User) -> Optional[str]:
+    """Resolve a user's API key when the auth path didn't carry it.
+
+    Users hydrated from the JWT fast path arrive without an api_key;
+    only the proxy paths that forward it upstream pay for the lookup --
+    Redis user cache first, then a unique point read by id.
+    """
+    if user.api_key:
+        return user.api_key
+
+    cache_key = f"ukey:{user.id}"
+    if _auth_cache is not None:
+        try:
+            cached = _auth_cache.get(cache_key)
+            if cached:
+                user.api_key = cached
+                return cached
+        except Exception as e:
+            logger.warning(f"API key cache read error: {e}")
+
+    conn = None
     try:
         conn = get_db_connection()
         with conn.cursor() as cursor:
-            cursor.execute("""
-                SELECT id, username, email, api_key, role, ou_id
-                FROM users
-                WHERE api_key = %s AND is_active = TRUE
-            """, (api_key,))
-            result = cursor.fetchone()
-
-            if result:
-                return User(
-                    id=result['id'],
-                    username=result['username'],
-                    email=result['email'],
-                    api_key=result['api_key'],
-                    role=result['role'],
-                    ou_id=result['ou_id']
-                )
+            cursor.execute(_SQL_API_KEY_BY_ID, (user.id,))
+            row = cursor.fetchone()
+        if row:
+            user.api_key = row['api_key']
+            if _auth_cache is not None:
+                try:
+                    _auth_cache.setex(cache_key, API_KEY_CACHE_TTL, user.api_key)
+                except Exception as e:
+                    logger.warning(f"API key cache write error: {e}")
+            return user.api_key
     except Exception as e:
-        logger.error(f"API key validation error: {e}")
+        logger.error(f"API key resolution error: {e}")
     finally:
-        conn.close()
+        if conn:
+            conn.close()
 
     return None
 
 
 def get_authenticated_user() -> Optional[User]:
-    """Get authenticated user from session or API key"""
+    """Get authenticated user from token, session or API key"""
     if not AUTH_ENABLED:
         return None
 
-    # Check session
-    session_id = session.get('session_id')
-    if session_id:
-        user = validate_session(session_id)
+    # Fresh signed token short-circuits the whole lookup
+    token = request.cookies.get(_JWT_COOKIE)
+    if token:
+        user = validate_jwt(token)
         if user:
             return user
 
-    # Check API key in Authorization header
+    # Collect both credential candidates, then resolve in one lookup
+    session_id = session.get('session_id')
+
+    api_key = None
     auth_header = request.headers.get('Authorization', '')
     if auth_header.startswith('Bearer '):
         api_key = auth_header[7:]
-        user = validate_api_key(api_key)
-        if user:
-            return user
 
-    return None
+    return validate_auth(session_id, api_key)
+
+
+# Everything in the /health payload except the timestamp is fixed at
+# import time; orchestrators probe this endpoint constantly, so build
+# the two status variants once and only stamp the timestamp per call
+_HEALTH_OK = {'status': 'healthy', 'database': 'healthy', 'auth_enabled': AUTH_ENABLED}
+_HEALTH_DEGRADED = {'status': 'degraded', 'database': 'unhealthy', 'auth_enabled': AUTH_ENABLED}
+
+# Cache the DB liveness verdict for a second to coalesce probe storms:
+# kubelet liveness/readiness probes can otherwise turn /health into a
+# steady stream of MySQL round-trips
+_HEALTH_CHECK_TTL = 1.0
+_health_db_ok = False
+_health_db_expires = 0.0
 
 
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    try:
-        # Check database connectivity
-        conn = get_db_connection()
-        conn.close()
-        db_status = 'healthy'
-    except Exception as e:
-        logger.error(f"Health check DB error: {e}")
-        db_status = 'unhealthy'
+    global _health_db_ok, _health_db_expires
+
+    now = time.monotonic()
+    if now >= _health_db_expires:
+        try:
+            # Borrow a pooled connection and run a trivial query; no
+            # handshake is paid since conn.close() returns it to the pool
+            conn = get_db_connection()
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+            finally:
+                conn.close()
+            _health_db_ok = True
+        except Exception as e:
+            logger.error(f"Health check DB error: {e}")
+            _health_db_ok = False
+        _health_db_expires = now + _HEALTH_CHECK_TTL
 
-    return jsonify({
-        'status': 'healthy' if db_status == 'healthy' else 'degraded',
-        'database': db_status,
-        'auth_enabled': AUTH_ENABLED,
-        'timestamp': datetime.utcnow().isoformat()
-    })
+    payload = dict(_HEALTH_OK if _health_db_ok else _HEALTH_DEGRADED)
+    payload['timestamp'] = datetime.utcnow().isoformat()
+    return jsonify(payload)
 
 
 @app.route('/api/auth/login', methods=['POST'])
@@ -203,40 +585,40 @@ def login():
 
     conn = None
     try:
-        # Validate credentials against database
+        # Validate credentials and create the session on one cursor:
+        # the SELECT and INSERT share the same connection anyway, and
+        # reopening a cursor between them just added an extra round of
+        # allocation on the login path
         conn = get_db_connection()
         with conn.cursor() as cursor:
-            cursor.execute("""
-                SELECT id, username, email, password_hash, api_key, role, ou_id
-                FROM users
-                WHERE username = %s AND is_active = TRUE
-            """, (username,))
+            cursor.execute(_SQL_LOGIN_SELECT, (username,))
             user_data = cursor.fetchone()
 
-        if not user_data:
-            logger.warning(f"Login failed: user not found - {username}")
-            return jsonify({'error': 'Invalid credentials'}), 401
+            if not user_data:
+                logger.warning(f"Login failed: user not found - {username}")
+                return jsonify({'error': 'Invalid credentials'}), 401
 
-        # Verify password
-        if not bcrypt.checkpw(password.encode('utf-8'), user_data['password_hash'].encode('utf-8')):
-            logger.warning(f"Login failed: invalid password - {username}")
-            return jsonify({'error': 'Invalid credentials'}), 401
+            # Verify password on a real OS thread, off the eventlet hub
+            password_ok = tpool.execute(
+                bcrypt.checkpw,
+                password.encode('utf-8'),
+                user_data['password_hash'].encode('utf-8')
+            )
+            if not password_ok:
+                logger.warning(f"Login failed: invalid password - {username}")
+                return jsonify({'error': 'Invalid credentials'}), 401
 
-        # Create session
-        session_id = secrets.token_hex(32)
-        expires_at = datetime.utcnow() + timedelta(hours=24)
+            # Create session
+            session_id = secrets.token_hex(32)
+            expires_at = datetime.utcnow() + timedelta(hours=24)
 
-        with conn.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO sessions (session_id, user_id, expires_at)
-                VALUES (%s, %s, %s)
-            """, (session_id, user_data['id'], expires_at))
+            cursor.execute(_SQL_SESSION_INSERT, (session_id, user_data['id'], expires_at))
 
         session['session_id'] = session_id
 
         logger.info(f"User logged in: {username}")
 
-        return jsonify({
+        response = jsonify({
             'success': True,
             'user': {
                 'id': user_data['id'],
@@ -246,6 +628,25 @@ def login():
             },
             'session_id': session_id
         })
+        # Issue the fast-path token alongside the session so follow-up
+        # requests skip the DB until it expires
+        user = User(
+            id=user_data['id'],
+            username=user_data['username'],
+            email=user_data['email'],
+            api_key=user_data['api_key'],
+            role=user_data['role'],
+            ou_id=user_data['ou_id']
+        )
+        response.set_cookie(
+            _JWT_COOKIE,
+            _issue_auth_token(user),
+            max_age=JWT_TTL,
+            httponly=True,
+            secure=app.config['SESSION_COOKIE_SECURE'],
+            samesite='Lax'
+        )
+        return response
 
     except Exception as e:
         logger.error(f"Login error: {e}")
@@ -266,13 +667,19 @@ def logout():
         try:
             conn = get_db_connection()
             with conn.cursor() as cursor:
-                cursor.execute("DELETE FROM sessions WHERE session_id = %s", (session_id,))
+                cursor.execute(_SQL_SESSION_DELETE, (session_id,))
             conn.close()
         except Exception as e:
             logger.error(f"Logout error: {e}")
+        # Invalidate the cached session and status immediately rather
+        # than waiting for the TTLs to lapse
+        _cache_delete(f"sess:{session_id}")
+        _cache_delete(f"authstatus:{session_id}")
 
     session.clear()
-    return jsonify({'success': True})
+    response = jsonify({'success': True})
+    response.delete_cookie(_JWT_COOKIE)
+    return response
 
 
 @app.route('/api/auth/status', methods=['GET'])
@@ -281,9 +688,25 @@ def auth_status():
     if not AUTH_ENABLED:
         return jsonify({'authenticated': False, 'auth_enabled': False})
 
+    # The frontend polls this endpoint; for the life of a session the
+    # response is stable, so serve the serialized body from the auth
+    # cache for a short TTL instead of re-running the DB lookup. Only
+    # authenticated responses are cached so a fresh login is visible
+    # immediately.
+    session_id = session.get('session_id')
+    cache_key = None
+    if session_id and _auth_cache is not None:
+        cache_key = f"authstatus:{session_id}"
+        try:
+            body = _auth_cache.get(cache_key)
+            if body:
+                return Response(body, mimetype='application/json')
+        except Exception as e:
+            logger.warning(f"Auth status cache read error: {e}")
+
     user = get_authenticated_user()
     if user:
-        return jsonify({
+        payload = {
             'authenticated': True,
             'auth_enabled': True,
             'user': {
@@ -292,48 +715,57 @@ def auth_status():
                 'email': user.email,
                 'role': user.role
             }
-        })
+        }
+        if cache_key:
+            body = json.dumps(payload)
+            try:
+                _auth_cache.setex(cache_key, AUTH_STATUS_CACHE_TTL, body)
+            except Exception as e:
+                logger.warning(f"Auth status cache write error: {e}")
+            return Response(body, mimetype='application/json')
+        return jsonify(payload)
 
     return jsonify({'authenticated': False, 'auth_enabled': True})
 
 
+# Hoisted from the two test handlers, which rebuilt a literal list and
+# walked it linearly on every request; frozenset membership is a single
+# hash probe against one shared constant
+_VALID_TEST_TYPES = frozenset((
+    'http', 'tcp', 'udp', 'icmp',
+    'http_trace', 'tcp_trace', 'udp_trace', 'traceroute'
+))
+
+
+class TestParams(msgspec.Struct):
+    """Validated test parameters.
+
+    One C-level msgspec pass replaces the previous chain of dict .get
+    calls and per-field try/except int conversions, which ran on every
+    test request and every WebSocket start_test event. Unknown keys
+    (test_type, protocol_detail, device fields) pass through untouched.
+    """
+
+    target: Annotated[str, msgspec.Meta(min_length=1, max_length=255)]
+    port: Optional[Annotated[int, msgspec.Meta(ge=1, le=65535)]] = None
+    timeout: Annotated[int, msgspec.Meta(ge=1, le=300)] = 30
+    count: Annotated[int, msgspec.Meta(ge=1, le=1000)] = 10
+
+
 def validate_test_params(data: Dict[str, Any], test_type: str) -> tuple[bool, Optional[str]]:
     """Validate test parameters with input sanitization"""
-    target = data.get('target', '').strip()
+    # Whitespace-only targets slip past a min_length check, so strip
+    # first as before
+    target = (data.get('target') or '').strip()
     if not target:
         return False, 'Target host is required'
 
-    # Basic hostname/IP validation
-    if len(target) > 255:
-        return False, 'Target host too long'
-
-    # Validate port if provided
-    port = data.get('port')
-    if port is not None:
-        try:
-            port = int(port)
-            if port < 1 or port > 65535:
-                return False, 'Invalid port number'
-        except (ValueError, TypeError):
-            return False, 'Invalid port number'
-
-    # Validate timeout
-    timeout = data.get('timeout', 30)
-    try:
-        timeout = int(timeout)
-        if timeout < 1 or timeout > 300:
-            return False, 'Timeout must be between 1 and 300 seconds'
-    except (ValueError, TypeError):
-        return False, 'Invalid timeout value'
-
-    # Validate count
-    count = data.get('count', 10)
     try:
-        count = int(count)
-        if count < 1 or count > 1000:
-            return False, 'Count must be between 1 and 1000'
-    except (ValueError, TypeError):
-        return False, 'Invalid count value'
+        # strict=False keeps the old int(...) coercion for string
+        # ports/timeouts/counts sent by older clients
+        msgspec.convert(data, TestParams, strict=False)
+    except msgspec.ValidationError as e:
+        return False, str(e)
 
     return True, None
 
@@ -341,7 +773,7 @@ def validate_test_params(data: Dict[str, Any], test_type: str) -> tuple[bool, Op
 @app.route('/api/test/<test_type>', methods=['POST'])
 def run_test(test_type: str):
     """Proxy test request to testServer"""
-    if test_type not in ['http', 'tcp', 'udp', 'icmp', 'http_trace', 'tcp_trace', 'udp_trace', 'traceroute']:
+    if test_type not in _VALID_TEST_TYPES:
         return jsonify({'error': 'Invalid test type'}), 400
 
     # Check authentication if enabled
@@ -367,7 +799,7 @@ def run_test(test_type: str):
             'timeout': data.get('timeout', 30),
             'count': data.get('count', 10),
             'protocol_detail': data.get('protocol_detail'),
-            'device_serial': data.get('device_serial', 'webclient-' + secrets.token_hex(4)),
+            'device_serial': data.get('device_serial') or _default_device_serial(),
             'device_hostname': data.get('device_hostname', 'webclient'),
             'device_os': 'Browser',
             'device_os_version': request.headers.get('User-Agent', 'Unknown')[:100]
@@ -375,22 +807,51 @@ def run_test(test_type: str):
 
         headers = {}
         if user:
-            headers['Authorization'] = f'ApiKey {user.api_key}'
-
-        # Forward to testServer
-        response = requests.post(
-            f'{TESTSERVER_URL}/api/v1/test/{test_type}',
-            json=test_request,
-            headers=headers,
-            timeout=data.get('timeout', 30) + 10
-        )
+            api_key = _resolve_api_key(user)
+            if api_key:
+                headers['Authorization'] = f'ApiKey {api_key}'
 
-        if response.status_code == 200:
-            logger.info(f"Test completed: {test_type} to {data.get('target')}")
-            return jsonify(response.json())
-        else:
-            logger.error(f"Test failed: {response.status_code} - {response.text}")
-            return jsonify({'error': 'Test execution failed', 'details': response.text}), response.status_code
+        # Forward to testServer under the in-flight cap
+        if not _upstream_sem.acquire(blocking=False):
+            return jsonify({'error': _UPSTREAM_BUSY_MSG}), 503
+        try:
+            upstream = _ts_session.post(
+                f'{TESTSERVER_URL}/api/v1/test/{test_type}',
+                json=test_request,
+                headers=headers,
+                timeout=data.get('timeout', 30) + 10,
+                stream=True
+            )
+        except BaseException:
+            _upstream_sem.release()
+            raise
+
+        if upstream.status_code != 200:
+            try:
+                details = upstream.text
+            finally:
+                _upstream_sem.release()
+            logger.error(f"Test failed: {upstream.status_code} - {details}")
+            return jsonify({'error': 'Test execution failed', 'details': details}), upstream.status_code
+
+        logger.info(f"Test completed: {test_type} to {data.get('target')}")
+
+        # Relay the upstream body as-is: this endpoint never inspects
+        # the result, so buffering it for a parse + re-serialize cycle
+        # only doubled memory and CPU on large counts. The semaphore
+        # slot is held until the body finishes streaming.
+        def _relay():
+            try:
+                yield from upstream.iter_content(16384)
+            finally:
+                upstream.close()
+                _upstream_sem.release()
+
+        return Response(
+            _relay(),
+            status=upstream.status_code,
+            content_type=upstream.headers.get('Content-Type', 'application/json')
+        )
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Test server communication error: {e}")
@@ -418,7 +879,7 @@ def handle_start_test(data):
     """Handle test execution via WebSocket for real-time updates"""
     test_type = data.get('test_type')
 
-    if test_type not in ['http', 'tcp', 'udp', 'icmp', 'http_trace', 'tcp_trace', 'udp_trace', 'traceroute']:
+    if test_type not in _VALID_TEST_TYPES:
         emit('error', {'error': 'Invalid test type'})
         return
 
@@ -454,7 +915,7 @@ def handle_start_test(data):
             'timeout': data.get('timeout', 30),
             'count': data.get('count', 10),
             'protocol_detail': data.get('protocol_detail'),
-            'device_serial': data.get('device_serial', 'webclient-' + secrets.token_hex(4)),
+            'device_serial': data.get('device_serial') or _default_device_serial(),
             'device_hostname': data.get('device_hostname', 'webclient'),
             'device_os': 'Browser',
             'device_os_version': 'WebSocket Client'
@@ -462,42 +923,51 @@ def handle_start_test(data):
 
         headers = {}
         if user:
-            headers['Authorization'] = f'ApiKey {user.api_key}'
+            api_key = _resolve_api_key(user)
+            if api_key:
+                headers['Authorization'] = f'ApiKey {api_key}'
             logger.info(f"WebSocket test: Authenticated as user {user.username} (ID: {user.id})")
         else:
             logger.warning("WebSocket test: No authentication (AUTH_ENABLED=False)")
 
-        # Execute test and stream results
+        # Execute test and stream results, under the in-flight cap;
+        # hold the slot until the body has been read so slow upstream
+        # responses still count against the limit
         logger.info(f"Sending test request to testServer: {TESTSERVER_URL}/api/v1/test/{test_type}")
-        response = requests.post(
-            f'{TESTSERVER_URL}/api/v1/test/{test_type}',
-            json=test_request,
-            headers=headers,
-            timeout=data.get('timeout', 30) + 10,
-            stream=True
-        )
+        if not _upstream_sem.acquire(blocking=False):
+            emit('error', {'error': _UPSTREAM_BUSY_MSG, 'status': 503})
+            return
+        try:
+            response = _ts_session.post(
+                f'{TESTSERVER_URL}/api/v1/test/{test_type}',
+                json=test_request,
+                headers=headers,
+                timeout=data.get('timeout', 30) + 10,
+                stream=True
+            )
+            body = response.content
+        finally:
+            _upstream_sem.release()
 
         logger.info(f"testServer response: {response.status_code}")
         if response.status_code == 200:
             # Try to parse as streaming JSON or return complete result
             try:
-                result = response.json()
-
-                # Simulate streaming for better UX if we got complete result
-                if isinstance(result, dict):
-                    # Send progress updates
-                    count = data.get('count', 10)
-                    for i in range(count):
-                        emit('test_progress', {
-                            'progress': (i + 1) / count * 100,
-                            'current_index': i + 1,
-                            'total': count
-                        })
-                        socketio.sleep(0.1)
-
-                    emit('test_complete', result)
-                else:
-                    emit('test_complete', result)
+                result = orjson.loads(body)
+
+                # The testServer returns one complete JSON document, so
+                # deliver it as soon as it arrives. The old code
+                # fabricated per-probe progress with a 100ms sleep per
+                # count after the test had already finished -- up to
+                # count * 100ms of pure added latency that also tied up
+                # the greenlet.
+                count = data.get('count', 10)
+                emit('test_progress', {
+                    'progress': 100,
+                    'current_index': count,
+                    'total': count
+                })
+                emit('test_complete', result)
 
             except Exception as e:
                 logger.error(f"Error parsing test result: {e}")
@@ -514,6 +984,12 @@ def handle_start_test(data):
         emit('error', {'error': 'Internal server error'})
 
 
+# Started at import so the sweeper also runs under gunicorn, where the
+# __main__ block never executes; the DELETE is idempotent, so multiple
+# replicas sweeping concurrently is harmless
+socketio.start_background_task(_session_sweeper)
+
+
 if __name__ == '__main__':
     logger.info(f"Starting webClient API server")
     logger.info(f"Auth enabled: {AUTH_ENABLED}")